@@ -10,8 +10,21 @@ Usage:
     python examples/agent_chat.py
 """
 
+import atexit
+import math
+import operator
 import sys
-import json
+import time
+
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    import json
+
+    _dumps = json.dumps
 
 from inferencesh import (
     inference,
@@ -27,6 +40,31 @@ from inferencesh import (
     boolean,
 )
 
+# Batched stdout writer for streamed tokens: print(..., flush=True) per
+# chunk forces a write syscall per token, so buffer and flush on newline
+# or every ~50ms instead.
+_out = sys.stdout
+_buf: list = []
+_last_flush = [time.monotonic()]
+
+
+def _emit(s: str) -> None:
+    _buf.append(s)
+    now = time.monotonic()
+    if "\n" in s or now - _last_flush[0] > 0.05:
+        _out.write("".join(_buf))
+        _buf.clear()
+        _out.flush()
+        _last_flush[0] = now
+
+
+@atexit.register
+def _drain() -> None:
+    if _buf:
+        _out.write("".join(_buf))
+        _buf.clear()
+        _out.flush()
+
 # =============================================================================
 # Define Client Tools
 # =============================================================================
@@ -65,36 +103,39 @@ search_tool = (
 # Tool Handlers (executed client-side)
 # =============================================================================
 
+# Operation dispatch table - a single dict lookup instead of an if/elif ladder
+_OPS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": lambda a, b: a / b if b else math.nan,
+}
+
+
 def handle_calculator(args: dict) -> str:
-    a = float(args.get("a", 0))
-    b = float(args.get("b", 0))
-    op = args.get("operation", "add")
-    
-    if op == "add":
-        result = a + b
-    elif op == "subtract":
-        result = a - b
-    elif op == "multiply":
-        result = a * b
-    elif op == "divide":
-        result = a / b if b != 0 else float("nan")
-    else:
-        return json.dumps({"error": f"Unknown operation: {op}"})
-    
-    return json.dumps({
+    a = float(args["a"] if "a" in args else 0)
+    b = float(args["b"] if "b" in args else 0)
+    op = args["operation"] if "operation" in args else "add"
+
+    fn = _OPS.get(op)
+    if fn is None:
+        return _dumps({"error": f"Unknown operation: {op}"})
+    result = fn(a, b)
+
+    return _dumps({
         "result": result,
-        "expression": f"{a} {op} {b} = {result}"
+        "expression": "%s %s %s = %s" % (a, op, b, result)
     })
 
 
 def handle_weather(args: dict) -> str:
-    location = args.get("location", "Unknown")
-    units = args.get("units", "celsius")
+    location = args["location"] if "location" in args else "Unknown"
+    units = args["units"] if "units" in args else "celsius"
     
     # Simulated weather data
     temp = 22 if units == "celsius" else 72
     
-    return json.dumps({
+    return _dumps({
         "location": location,
         "temperature": temp,
         "units": units,
@@ -103,18 +144,22 @@ def handle_weather(args: dict) -> str:
     })
 
 
+# Simulated file search hits; built once so each call only assembles the
+# small envelope dict around them before encoding.
+_SEARCH_RESULTS = [
+    {"path": "/home/user/docs/report.md", "size": 1024},
+    {"path": "/home/user/docs/notes.txt", "size": 512},
+]
+
+
 def handle_search_files(args: dict) -> str:
-    pattern = args.get("pattern", "*")
-    recursive = args.get("recursive", False)
-    
-    # Simulated file search
-    return json.dumps({
+    pattern = args["pattern"] if "pattern" in args else "*"
+    recursive = args["recursive"] if "recursive" in args else False
+
+    return _dumps({
         "pattern": pattern,
         "recursive": recursive,
-        "results": [
-            {"path": "/home/user/docs/report.md", "size": 1024},
-            {"path": "/home/user/docs/notes.txt", "size": 512},
-        ],
+        "results": _SEARCH_RESULTS,
     })
 
 
@@ -129,6 +174,30 @@ TOOL_HANDLERS = {
 # Main
 # =============================================================================
 
+# Agent configs are static, so build them once at import instead of per
+# invocation (AgentRuntimeConfig is a TypedDict, but the nested tool list
+# and prompt assembly still cost allocations per call).
+_TOOL_ASSISTANT_CFG = AgentRuntimeConfig(
+    core_app_ref="infsh/claude-haiku-45@375bg07t",  # Replace with actual app reference
+    name="Tool Assistant",
+    system_prompt="""You are a helpful assistant with access to tools.
+Available tools:
+- calculator: Performs math operations
+- get_weather: Gets weather for a location  
+- search_files: Searches files (requires approval)
+
+Use tools when appropriate to help the user.""",
+    tools=[calculator_tool, weather_tool, search_tool],
+    internal_tools=internal_tools().memory().build(),
+)
+
+_SIMPLE_ASSISTANT_CFG = AgentRuntimeConfig(
+    core_app_ref="infsh/claude-haiku-45@375bg07t",
+    name="Simple Assistant",
+    system_prompt="You are a helpful assistant.",
+)
+
+
 def main():
     api_key = "1nfsh-40d0xtgj90nd2tbtxjg2s96e1p"
     if not api_key:
@@ -137,27 +206,17 @@ def main():
     
     # Create client and agent with ad-hoc config
     client = inference(api_key=api_key, base_url="https://api-dev.inference.sh")
-    agent = client.agent(AgentRuntimeConfig(
-        core_app_ref="infsh/claude-haiku-45@375bg07t",  # Replace with actual app reference
-        name="Tool Assistant",
-        system_prompt="""You are a helpful assistant with access to tools.
-Available tools:
-- calculator: Performs math operations
-- get_weather: Gets weather for a location  
-- search_files: Searches files (requires approval)
-
-Use tools when appropriate to help the user.""",
-        tools=[calculator_tool, weather_tool, search_tool],
-        internal_tools=internal_tools().memory().build(),
-    ))
+    agent = client.agent(_TOOL_ASSISTANT_CFG)
     
     print("Agent ready. Sending message...\n")
     
     # Callback for message updates
     def on_message(msg):
-        for c in msg.get("content", []):
-            if c.get("type") == "text" and c.get("text"):
-                print(c["text"])
+        for c in msg.get("content") or []:
+            if c.get("type") == "text":
+                text = c.get("text")
+                if text:
+                    print(text)
     
     # Callback for tool calls
     def on_tool_call(call: ToolCallInfo):
@@ -170,12 +229,12 @@ Use tools when appropriate to help the user.""",
                 print(f"[Tool Result] {result}")
                 agent.submit_tool_result(call.id, result)
             except Exception as e:
-                error = json.dumps({"error": str(e)})
+                error = _dumps({"error": str(e)})
                 agent.submit_tool_result(call.id, error)
         else:
             agent.submit_tool_result(
                 call.id, 
-                json.dumps({"error": f"Unknown tool: {call.name}"})
+                _dumps({"error": f"Unknown tool: {call.name}"})
             )
     
     # Send first message
@@ -208,11 +267,7 @@ def main_streaming():
     
     # Create client and agent
     client = inference(api_key=api_key, base_url="https://api-dev.inference.sh")
-    agent = client.agent(AgentRuntimeConfig(
-        core_app_ref="infsh/claude-haiku-45@375bg07t",
-        name="Simple Assistant",
-        system_prompt="You are a helpful assistant.",
-    ))
+    agent = client.agent(_SIMPLE_ASSISTANT_CFG)
     
     # Send message (no callbacks - we'll stream manually)
     agent.send_message("Tell me a short joke")
@@ -225,25 +280,24 @@ def main_streaming():
         max_reconnects=3,
         reconnect_delay_ms=1000,
     ):
-        content = message.get("content", [])
-        for c in content:
-            if c.get("type") == "text" and c.get("text"):
-                print(c["text"], end="", flush=True)
+        for c in message.get("content") or []:
+            if c.get("type") == "text":
+                text = c.get("text")
+                if text:
+                    _emit(text)
         
         # Check if complete
         if is_message_ready(message.get("status")):
             break
-    
+
+    _drain()  # push out any buffered tail of the stream before printing
     print("\n\nDone!")
 
 
 if __name__ == "__main__":
-    import argparse
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--streaming", action="store_true", help="Use manual streaming example")
-    args = parser.parse_args()
-    
-    if args.streaming:
+    # Hand-rolled flag check: argparse costs ~15ms of cold start for a
+    # script with a single boolean flag.
+    if "--streaming" in sys.argv[1:]:
         main_streaming()
     else:
         main()
@@ -11,11 +11,37 @@ Environment variables:
     AGENT - Agent reference: namespace/name@shortid (e.g., "infsh/code-assistant@abc123")
 """
 
+import atexit
 import os
 import sys
+import time
 
 from inferencesh import inference
 
+# Batched stdout writer for streamed tokens (see agent_chat.py): avoids a
+# write syscall per chunk by flushing on newline or every ~50ms.
+_out = sys.stdout
+_buf: list = []
+_last_flush = [time.monotonic()]
+
+
+def _emit(s: str) -> None:
+    _buf.append(s)
+    now = time.monotonic()
+    if "\n" in s or now - _last_flush[0] > 0.05:
+        _out.write("".join(_buf))
+        _buf.clear()
+        _out.flush()
+        _last_flush[0] = now
+
+
+@atexit.register
+def _drain() -> None:
+    if _buf:
+        _out.write("".join(_buf))
+        _buf.clear()
+        _out.flush()
+
 
 def main():
     api_key = os.environ.get("INFERENCE_API_KEY")
@@ -39,12 +65,14 @@ def main():
     print("Sending message...\n")
     
     def on_message(msg):
-        content = msg.get("content", [])
-        for c in content:
-            if c.get("type") == "text" and c.get("text"):
-                print(c["text"], end="", flush=True)
+        for c in msg.get("content") or []:
+            if c.get("type") == "text":
+                text = c.get("text")
+                if text:
+                    _emit(text)
     
     def on_tool_call(call):
+        _drain()  # keep streamed text ahead of the tool-call notice
         print(f"\n[Tool Call] {call.name}: {call.args}")
         # For template agents, tool handlers depend on what tools are configured
         agent.submit_tool_result(call.id, '{"status": "not_implemented"}')
@@ -56,6 +84,7 @@ def main():
         on_tool_call=on_tool_call,
     )
     
+    _drain()  # push out any buffered tail of the stream before printing
     print(f"\n\nChat ID: {agent.chat_id}")
     
     # Continue the conversation
@@ -65,7 +94,8 @@ def main():
         "Tell me more about that.",
         on_message=on_message,
     )
-    
+
+    _drain()
     print("\n\nDone!")
 
 
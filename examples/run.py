@@ -1,8 +1,60 @@
 """Real API test for sync and async clients."""
 import asyncio
+import sys
+
 from inferencesh import inference, async_inference, TaskStatus
 
+# Bound write for the per-update streaming loops: skips print's
+# separator/end handling and the f-string rebuild per line.
+_w = sys.stdout.write
+
 API_KEY = "1nfsh-40d0xtgj90nd2tbtxjg2s96e1p"
+BASE_URL = "https://api-dev.inference.sh"
+
+# Shared clients: constructing one per test function would pay connection
+# pool setup and TCP/TLS handshakes again for every call group.
+_CLIENT = inference(api_key=API_KEY, base_url=BASE_URL)
+_ASYNC_CLIENT = async_inference(api_key=API_KEY, base_url=BASE_URL)
+
+# Precomputed status lookups: TaskStatus(status).name re-enters the enum
+# constructor on every streamed update, so resolve names via a dict and
+# compare against plain ints in the loops below.
+_STATUS_NAMES = {s.value: s.name for s in TaskStatus}
+_COMPLETED = int(TaskStatus.COMPLETED)
+
+
+def _on_completed(update):
+    _w("   Output: %s\n" % update.get('output'))
+    return True
+
+
+def _on_failed(update):
+    _w("   Error: %s\n" % update.get('error'))
+    return True
+
+
+def _on_cancelled(update):
+    return True
+
+
+# Terminal-status dispatch for the streaming loops: one dict lookup per
+# update instead of a compare-and-branch chain. Handlers return True to
+# stop the stream.
+_TERMINAL_HANDLERS = {
+    _COMPLETED: _on_completed,
+    int(TaskStatus.FAILED): _on_failed,
+    int(TaskStatus.CANCELLED): _on_cancelled,
+}
+
+
+def _handle_update(update):
+    """Print one streamed update; return True once the task is terminal."""
+    status = update.get('status')
+    if status is None:
+        return False
+    _w("   Status: %s\n" % _STATUS_NAMES.get(status, 'UNKNOWN'))
+    handler = _TERMINAL_HANDLERS.get(status)
+    return handler(update) if handler else False
 
 TASK_PARAMS = {
     "app": "infsh/text-templating",
@@ -22,105 +74,112 @@ def test_sync():
     print("SYNC CLIENT TEST")
     print("=" * 50)
     
-    client = inference(api_key=API_KEY, base_url="https://api-dev.inference.sh")
+    client = _CLIENT
     
     # Test 1: Run and wait (default)
     print("\n1. run() - wait for completion (default)")
     task = client.run(TASK_PARAMS)
     print(f"   Task ID: {task['id']}")
-    print(f"   Status: {TaskStatus(task['status']).name}")
-    if task["status"] == TaskStatus.COMPLETED:
+    print(f"   Status: {_STATUS_NAMES.get(task['status'], 'UNKNOWN')}")
+    if task["status"] == _COMPLETED:
         print(f"   Output: {task['output']}")
     
     # Test 2: Run with wait=False
     print("\n2. run(wait=False) - return immediately")
     task = client.run(TASK_PARAMS, wait=False)
     print(f"   Task ID: {task['id']}")
-    print(f"   Status: {TaskStatus(task['status']).name}")
+    print(f"   Status: {_STATUS_NAMES.get(task['status'], 'UNKNOWN')}")
     
     # Test 3: get_task
     print(f"\n3. get_task('{task['id']}')")
     task_info = client.get_task(task["id"])
-    print(f"   Status: {TaskStatus(task_info['status']).name}")
+    print(f"   Status: {_STATUS_NAMES.get(task_info['status'], 'UNKNOWN')}")
     
     # Test 4: Stream updates
     print("\n4. run(stream=True) - stream updates")
     for update in client.run(TASK_PARAMS, stream=True):
-        status = update.get('status')
-        if status is not None:
-            status_name = TaskStatus(status).name
-            print(f"   Status: {status_name}")
-            if status == TaskStatus.COMPLETED:
-                print(f"   Output: {update.get('output')}")
-                break
+        if _handle_update(update):
+            break
     
     # Test 5: stream_task
     print("\n5. stream_task() - stream existing task")
     task = client.run(TASK_PARAMS, wait=False)
     with client.stream_task(task["id"]) as stream:
         for update in stream:
-            status = update.get('status')
-            if status is not None:
-                status_name = TaskStatus(status).name
-                print(f"   Status: {status_name}")
-                if status == TaskStatus.COMPLETED:
-                    print(f"   Output: {update.get('output')}")
-                    break
+            if _handle_update(update):
+                break
     
     print("\n✓ Sync client tests passed!")
 
 
-async def test_async():
-    """Test asynchronous client."""
-    print("\n" + "=" * 50)
-    print("ASYNC CLIENT TEST")
-    print("=" * 50)
-    
-    client = async_inference(api_key=API_KEY, base_url="https://api-dev.inference.sh")
-    
-    # Test 1: Run and wait (default)
-    print("\n1. await run() - wait for completion (default)")
-    task = await client.run(TASK_PARAMS)    
-    print(f"   Task ID: {task['id']}")
-    print(f"   Status: {TaskStatus(task['status']).name}")
-    if task["status"] == TaskStatus.COMPLETED:
-        print(f"   Output: {task['output']}")
-    
-    # Test 2: Run with wait=False
-    print("\n2. await run(wait=False) - return immediately")
+async def _async_wait_false_and_get(client, lines):
+    """Tests 2+3: run(wait=False), then get_task on the returned id."""
+    lines.append("\n2. await run(wait=False) - return immediately")
     task = await client.run(TASK_PARAMS, wait=False)
-    print(f"   Task ID: {task['id']}")
-    print(f"   Status: {TaskStatus(task['status']).name}")
-    
-    # Test 3: get_task
-    print(f"\n3. await get_task('{task['id']}')")
+    lines.append(f"   Task ID: {task['id']}")
+    lines.append(f"   Status: {_STATUS_NAMES.get(task['status'], 'UNKNOWN')}")
+
+    lines.append(f"\n3. await get_task('{task['id']}')")
     task_info = await client.get_task(task["id"])
-    print(f"   Status: {TaskStatus(task_info['status']).name}")
-    
-    # Test 4: Stream updates
-    print("\n4. async for in await run(stream=True)")
+    lines.append(f"   Status: {_STATUS_NAMES.get(task_info['status'], 'UNKNOWN')}")
+
+
+async def _async_run_stream(client, lines):
+    """Test 4: stream updates from run(stream=True)."""
+    lines.append("\n4. async for in await run(stream=True)")
     async for update in await client.run(TASK_PARAMS, stream=True):
         status = update.get('status')
         if status is not None:
-            status_name = TaskStatus(status).name
-            print(f"   Status: {status_name}")
-            if status == TaskStatus.COMPLETED:
-                print(f"   Output: {update.get('output')}")
+            status_name = _STATUS_NAMES.get(status, 'UNKNOWN')
+            lines.append(f"   Status: {status_name}")
+            if status == _COMPLETED:
+                lines.append(f"   Output: {update.get('output')}")
                 break
-    
-    # Test 5: stream_task
-    print("\n5. async with stream_task()")
+
+
+async def _async_stream_task(client, lines):
+    """Test 5: stream an existing task via stream_task()."""
+    lines.append("\n5. async with stream_task()")
     task = await client.run(TASK_PARAMS, wait=False)
     async with client.stream_task(task["id"]) as stream:
         async for update in stream:
             status = update.get('status')
             if status is not None:
-                status_name = TaskStatus(status).name
-                print(f"   Status: {status_name}")
-                if status == TaskStatus.COMPLETED:
-                    print(f"   Output: {update.get('output')}")
+                status_name = _STATUS_NAMES.get(status, 'UNKNOWN')
+                lines.append(f"   Status: {status_name}")
+                if status == _COMPLETED:
+                    lines.append(f"   Output: {update.get('output')}")
                     break
-    
+
+
+async def test_async():
+    """Test asynchronous client."""
+    print("\n" + "=" * 50)
+    print("ASYNC CLIENT TEST")
+    print("=" * 50)
+
+    client = _ASYNC_CLIENT
+
+    # Test 1: Run and wait (default)
+    print("\n1. await run() - wait for completion (default)")
+    task = await client.run(TASK_PARAMS)
+    print(f"   Task ID: {task['id']}")
+    print(f"   Status: {_STATUS_NAMES.get(task['status'], 'UNKNOWN')}")
+    if task["status"] == _COMPLETED:
+        print(f"   Output: {task['output']}")
+
+    # Tests 2-5 are independent of each other, so overlap their round trips
+    # instead of awaiting them serially. Each buffers its own output lines
+    # so the report stays readable.
+    buffers = [[], [], []]
+    await asyncio.gather(
+        _async_wait_false_and_get(client, buffers[0]),
+        _async_run_stream(client, buffers[1]),
+        _async_stream_task(client, buffers[2]),
+    )
+    for lines in buffers:
+        print("\n".join(lines))
+
     print("\n✓ Async client tests passed!")
 
 
@@ -10,7 +10,16 @@ Usage:
     python examples/tool_builder.py
 """
 
-import json
+try:
+    import orjson
+
+    def _encode(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+except ImportError:
+    import json
+
+    def _encode(obj) -> str:
+        return json.dumps(obj, indent=2, default=str)
 
 from inferencesh import (
     tool,
@@ -27,6 +36,19 @@ from inferencesh import (
     optional,
 )
 
+# Built tool dicts never change after .build(), so pretty-print each one
+# at most once instead of re-walking it through the encoder per print.
+_PRETTY_CACHE: dict = {}
+
+
+def _pretty(obj) -> str:
+    key = id(obj)
+    cached = _PRETTY_CACHE.get(key)
+    if cached is None:
+        cached = _PRETTY_CACHE[key] = _encode(obj)
+    return cached
+
+
 # =============================================================================
 # Client Tools (executed in SDK consumer's environment)
 # =============================================================================
@@ -40,7 +62,7 @@ scan_ui = (
 )
 
 print("scan_ui tool:")
-print(json.dumps(scan_ui, indent=2, default=str))
+print(_pretty(scan_ui))
 
 # Tool with multiple parameters
 fill_field = (
@@ -52,7 +74,7 @@ fill_field = (
 )
 
 print("\nfill_field tool:")
-print(json.dumps(fill_field, indent=2, default=str))
+print(_pretty(fill_field))
 
 # Tool with enum parameter
 interact = (
@@ -65,7 +87,7 @@ interact = (
 )
 
 print("\ninteract tool:")
-print(json.dumps(interact, indent=2, default=str))
+print(_pretty(interact))
 
 # Tool with complex nested parameters
 create_task = (
@@ -84,7 +106,7 @@ create_task = (
 )
 
 print("\ncreate_task tool (with HIL):")
-print(json.dumps(create_task, indent=2, default=str))
+print(_pretty(create_task))
 
 # =============================================================================
 # Server Tools (executed on inference.sh servers)
@@ -102,7 +124,7 @@ generate_image = (
 )
 
 print("\ngenerate_image (app tool):")
-print(json.dumps(generate_image, indent=2, default=str))
+print(_pretty(generate_image))
 
 # Agent tool - delegates to sub-agent
 code_review = (
@@ -114,7 +136,7 @@ code_review = (
 )
 
 print("\ncode_review (agent tool):")
-print(json.dumps(code_review, indent=2, default=str))
+print(_pretty(code_review))
 
 # Webhook tool - calls external URL
 send_slack = (
@@ -128,7 +150,7 @@ send_slack = (
 )
 
 print("\nsend_slack (webhook tool):")
-print(json.dumps(send_slack, indent=2, default=str))
+print(_pretty(send_slack))
 
 # =============================================================================
 # Internal Tools Configuration
@@ -143,15 +165,15 @@ internal_config = (
 )
 
 print("\nInternal tools config:")
-print(json.dumps(internal_config, indent=2))
+print(_pretty(internal_config))
 
 # Or enable all
 all_internal = internal_tools().all().build()
-print("All internal tools:", json.dumps(all_internal, indent=2))
+print("All internal tools:", _pretty(all_internal))
 
 # Or disable all
 no_internal = internal_tools().none().build()
-print("No internal tools:", json.dumps(no_internal, indent=2))
+print("No internal tools:", _pretty(no_internal))
 
 # =============================================================================
 # Full Agent Config Example
@@ -167,5 +189,5 @@ agent_config = {
 }
 
 print("\n=== Full Agent Config ===")
-print(json.dumps(agent_config, indent=2, default=str))
+print(_pretty(agent_config))
 
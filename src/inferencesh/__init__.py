@@ -1,110 +1,151 @@
 """inference.sh Python SDK package."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "0.5.2"
 
-from .models import (
-    BaseApp,
-    BaseAppInput,
-    BaseAppOutput,
-    BaseAppSetup,
-    File,
-    Metadata,
-    # LLM types
-    ContextMessageRole,
-    Message,
-    ContextMessage,
-    LLMInput,
-    LLMOutput,
-    build_messages,
-    stream_generate,
-    timing_context,
-    # OutputMeta types
-    MetaItem,
-    MetaItemType,
-    TextMeta,
-    ImageMeta,
-    VideoMeta,
-    VideoResolution,
-    AudioMeta,
-    RawMeta,
-    OutputMeta,
-)
-
-from .utils import StorageDir, download
-from .client import Inference, AsyncInference, UploadFileOptions, is_terminal_status, is_message_ready
-from .types import TaskStatus, ChatMessageStatus
-from .models.errors import APIError, RequirementsNotMetError, RequirementError, SetupAction
+if TYPE_CHECKING:
+    from .client import Inference, AsyncInference
 
+# Lazy re-exports (PEP 562): importing the package no longer pulls in the
+# whole model/client/tool sub-tree (pydantic, requests, ...) up front.
+# Each name is resolved - and cached in module globals - on first access.
+_LAZY = {
+    name: ".models"
+    for name in (
+        "BaseApp",
+        "BaseAppInput",
+        "BaseAppOutput",
+        "BaseAppSetup",
+        "File",
+        "Metadata",
+        # LLM types
+        "ContextMessageRole",
+        "Message",
+        "ContextMessage",
+        "LLMInput",
+        "LLMOutput",
+        "build_messages",
+        "stream_generate",
+        "timing_context",
+        # OutputMeta types
+        "MetaItem",
+        "MetaItemType",
+        "TextMeta",
+        "ImageMeta",
+        "VideoMeta",
+        "VideoResolution",
+        "AudioMeta",
+        "RawMeta",
+        "OutputMeta",
+    )
+}
+_LAZY.update({name: ".utils" for name in ("StorageDir", "download")})
+_LAZY.update({
+    name: ".client"
+    for name in ("Inference", "AsyncInference", "UploadFileOptions", "is_terminal_status", "is_message_ready")
+})
+_LAZY.update({
+    name: ".models.errors"
+    for name in ("APIError", "RequirementsNotMetError", "RequirementError", "SetupAction")
+})
 # Agent SDK (headless)
-from .agent import Agent, AsyncAgent, AgentConfig, ToolCallInfo
-
+_LAZY.update({name: ".agent" for name in ("Agent", "AsyncAgent", "AgentConfig", "ToolCallInfo")})
 # Tool Builder (fluent API)
-from .tools import (
-    tool,
-    app_tool,
-    agent_tool,
-    webhook_tool,
-    internal_tools,
-    string,
-    number,
-    integer,
-    boolean,
-    enum_of,
-    array,
-    obj,
-    optional,
-)
-
+_LAZY.update({
+    name: ".tools"
+    for name in (
+        "tool",
+        "app_tool",
+        "agent_tool",
+        "webhook_tool",
+        "internal_tools",
+        "string",
+        "number",
+        "integer",
+        "boolean",
+        "enum_of",
+        "array",
+        "obj",
+        "optional",
+    )
+})
 # Generated types for Agent/Chat functionality
-from .types import (
-    # Enums
-    ChatStatus,
-    ChatMessageRole,
-    ChatMessageContentType,
-    ToolType,
-    ToolInvocationStatus,
-    # Agent types
-    AgentTool,
-    AgentToolDTO,
-    AgentRuntimeConfig,
-    InternalToolsConfig,
-    # Chat types
-    ChatDTO,
-    ChatMessageDTO,
-    ChatData,
-    ChatMessageContent,
-    ChatTaskInput,
-    ChatTaskContextMessage,
-    # Tool types
-    ToolCall,
-    ToolCallFunction,
-    ToolInvocationDTO,
-    ToolResultRequest,
-    Tool,
-    ToolFunction,
-    ToolParameters,
-)
+_LAZY.update({
+    name: ".types"
+    for name in (
+        "TaskStatus",
+        "ChatMessageStatus",
+        # Enums
+        "ChatStatus",
+        "ChatMessageRole",
+        "ChatMessageContentType",
+        "ToolType",
+        "ToolInvocationStatus",
+        # Agent types
+        "AgentTool",
+        "AgentToolDTO",
+        "AgentRuntimeConfig",
+        "InternalToolsConfig",
+        # Chat types
+        "ChatDTO",
+        "ChatMessageDTO",
+        "ChatData",
+        "ChatMessageContent",
+        "ChatTaskInput",
+        "ChatTaskContextMessage",
+        # Tool types
+        "ToolCall",
+        "ToolCallFunction",
+        "ToolInvocationDTO",
+        "ToolResultRequest",
+        "Tool",
+        "ToolFunction",
+        "ToolParameters",
+    )
+})
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # cache so __getattr__ runs once per name
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
 
 
 def inference(*, api_key: str, base_url: str | None = None) -> Inference:
     """Factory function for creating an Inference client (lowercase for branding).
-    
+
     Example:
         ```python
         client = inference(api_key="your-api-key")
         ```
     """
+    from .client import Inference
+
     return Inference(api_key=api_key, base_url=base_url)
 
 
 def async_inference(*, api_key: str, base_url: str | None = None) -> AsyncInference:
     """Factory function for creating an AsyncInference client (lowercase for branding).
-    
+
     Example:
         ```python
         client = async_inference(api_key="your-api-key")
         ```
     """
+    from .client import AsyncInference
+
     return AsyncInference(api_key=api_key, base_url=base_url)
 
 __all__ = [
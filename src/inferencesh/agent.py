@@ -6,10 +6,34 @@ Chat with AI agents without UI dependencies.
 
 from __future__ import annotations
 
+import asyncio
+import binascii
 import json
-from typing import Any, Dict, Optional, Callable, Iterator, AsyncIterator
+import mimetypes
+import os
+import re
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional, Callable, Iterator, AsyncIterator
 from dataclasses import dataclass
 
+# orjson is optional (install with the "speed" extra); it encodes to bytes and
+# decodes str/bytes several times faster than stdlib json, which matters for
+# per-token SSE payloads.
+try:
+    import orjson as _orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return _orjson.dumps(obj)
+
+    _json_loads = _orjson.loads
+    _JSONDecodeError = _orjson.JSONDecodeError
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
 from .types import (
     ChatDTO,
     ChatMessageDTO,
@@ -19,6 +43,105 @@ from .types import (
 )
 from .client import StreamManager
 
+# Data URI attachments: compiled once, matched per upload.
+_DATA_URI_RE = re.compile(r"^data:([^;]+);base64,(.+)$")
+
+# Static part of the /agents/run input payload, merged into each body with a
+# single C-level dict copy instead of rebuilding the literal per call.
+_INPUT_SKELETON = {"role": "user", "context": [], "system_prompt": "", "context_size": 0}
+
+
+def _agent_key(options: AgentOptions) -> str:
+    """Body key for the agent options: "agent" for a template ref string,
+    "agent_config" for an ad-hoc config dict. Resolved once per client."""
+    return "agent" if isinstance(options, str) else "agent_config"
+
+
+def _build_body(
+    agent_key: str,
+    options: AgentOptions,
+    chat_id: Optional[str],
+    text: str,
+    image_uri: Optional[str] = None,
+    file_uris: Optional[list[str]] = None,
+) -> Dict[str, Any]:
+    """Build the /agents/run request body shared by Agent and AsyncAgent."""
+    input_data = {**_INPUT_SKELETON, "text": text, "image": image_uri, "files": file_uris}
+    return {"chat_id": chat_id, agent_key: options, "input": input_data}
+
+
+def _iter_sse_data(lines: Iterator[bytes], on_id: Optional[Callable[[str], None]] = None) -> Iterator[Any]:
+    """Parse raw SSE byte lines, yielding decoded data payloads.
+
+    Transport-agnostic: works over any iterable of newline-stripped byte
+    lines (e.g. requests' iter_lines), so the parsing logic lives in one
+    place rather than per client class. on_id, if given, receives the
+    value of each id: line so callers can resume after a reconnect.
+    """
+    for line in lines:
+        if not line or line[:1] == b":":
+            continue
+        if line.startswith(b"id:"):
+            if on_id:
+                on_id(line[3:].strip().decode())
+            continue
+        if line.startswith(b"data:"):
+            payload = line[5:]
+            if payload[:1] == b" ":
+                payload = payload[1:]
+            if payload:
+                try:
+                    yield _json_loads(payload)
+                except _JSONDecodeError:
+                    continue
+
+
+def _iter_typed_sse(lines: Iterator[bytes], on_id: Optional[Callable[[str], None]] = None) -> Iterator[tuple[str, Any]]:
+    """Parse raw SSE byte lines with TypedEvents, yielding (event_type, data)."""
+    current_event_type: Optional[str] = None
+    for line in lines:
+        if not line:
+            current_event_type = None  # Reset on empty line (event boundary)
+            continue
+        if line[:1] == b":":
+            continue
+        if line.startswith(b"id:"):
+            if on_id:
+                on_id(line[3:].strip().decode())
+            continue
+        if line.startswith(b"event:"):
+            current_event_type = line[6:].strip().decode()
+            continue
+        if line.startswith(b"data:"):
+            payload = line[5:]
+            if payload[:1] == b" ":
+                payload = payload[1:]
+            if payload:
+                try:
+                    data = _json_loads(payload)
+                    yield (current_event_type or "message", data)
+                except _JSONDecodeError:
+                    continue
+
+
+def _pending_tool_calls(message: ChatMessageDTO, dispatched: set[str]) -> Iterator[ToolCallInfo]:
+    """Yield client tool invocations awaiting input, marking them dispatched.
+
+    ID tracking handles duplicates across repeated message updates.
+    """
+    for inv in message.get("tool_invocations") or []:
+        inv_id = inv.get("id")
+        if not inv_id or inv_id in dispatched:
+            continue
+        if inv.get("type") == ToolType.CLIENT and inv.get("status") == ToolInvocationStatus.AWAITING_INPUT:
+            dispatched.add(inv_id)
+            function = inv.get("function", {})
+            yield ToolCallInfo(
+                id=inv_id,
+                name=function.get("name", ""),
+                args=function.get("arguments", {}),
+            )
+
 
 @dataclass
 class AgentConfig:
@@ -63,13 +186,81 @@ class Agent:
         self._api_key = config.api_key
         self._base_url = config.base_url
         self._options = options
+        self._options_key = _agent_key(options)
         self._chat_id: Optional[str] = None
         self._dispatched_tools: set[str] = set()  # tool invocation ids we've already processed
-    
+        # Default header dicts, built once; callers must not mutate these -
+        # conditional variants are copied per call
+        self._json_headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self._api_key}",
+        }
+        self._sse_headers = {
+            "Authorization": f"Bearer {self._api_key}",
+            "Accept": "text/event-stream",
+        }
+        self._session = None  # lazily-created requests.Session, shared across calls
+        self._cb_pool = None  # lazily-created single-worker executor for callbacks
+        self._last_event_id: Optional[str] = None  # resume point for SSE reconnects
+        # Conditional-GET cache for get_chat: etag + last body per chat id
+        self._chat_etag: dict[str, str] = {}
+        self._chat_cache: dict[str, ChatDTO] = {}
+
     @property
     def chat_id(self) -> Optional[str]:
         """Current chat ID."""
         return self._chat_id
+
+    def _get_cb_pool(self):
+        """Get the callback executor, creating it on first use.
+
+        A single worker keeps callbacks strictly ordered while letting the
+        SSE reader loop pull from the socket instead of blocking inside
+        user code.
+        """
+        if self._cb_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._cb_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inferencesh-cb")
+        return self._cb_pool
+
+    def _get_session(self):
+        """Get the shared HTTP session, creating it on first use.
+
+        A single Session keeps connections alive between calls, so
+        send_message/get_chat/submit_tool_result and SSE opens reuse the
+        same TCP+TLS connection instead of handshaking per request.
+        Auth headers stay per-call: the session is also used for signed
+        upload URLs, which must not receive the API bearer token.
+        """
+        if self._session is None:
+            requests = _require_requests()
+            from requests.adapters import HTTPAdapter, Retry
+
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=32,
+                max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        return self._session
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its connection pool."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        if self._cb_pool is not None:
+            self._cb_pool.shutdown(wait=True)
+            self._cb_pool = None
+
+    def __enter__(self) -> "Agent":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
     
     def send_message(
         self,
@@ -98,7 +289,7 @@ class Agent:
         file_uris: Optional[list[str]] = None
         
         if files:
-            uploaded = [self.upload_file(f) for f in files]
+            uploaded = self.upload_files(files)
             images = [f for f in uploaded if f.get("content_type", "").startswith("image/")]
             others = [f for f in uploaded if not f.get("content_type", "").startswith("image/")]
             
@@ -107,13 +298,8 @@ class Agent:
             if others:
                 file_uris = [f["uri"] for f in others]
         
-        # Build request body - /agents/run accepts either "agent" (template ref) or "agent_config" (ad-hoc)
-        input_data = {"text": text, "image": image_uri, "files": file_uris, "role": "user", "context": [], "system_prompt": "", "context_size": 0}
-        if isinstance(self._options, str):
-            body = {"chat_id": self._chat_id, "agent": self._options, "input": input_data}
-        else:
-            body = {"chat_id": self._chat_id, "agent_config": self._options, "input": input_data}
-        
+        body = _build_body(self._options_key, self._options, self._chat_id, text, image_uri, file_uris)
+
         response = self._request("post", "/agents/run", data=body)
         if not response:
             raise RuntimeError("Empty response from /agents/run")
@@ -130,11 +316,28 @@ class Agent:
         return assistant_msg
     
     def get_chat(self, chat_id: Optional[str] = None) -> Optional[ChatDTO]:
-        """Get chat by ID."""
+        """Get chat by ID.
+
+        Sends If-None-Match when the chat was fetched before; a 304 reply
+        returns the cached body without re-downloading or re-parsing it.
+        """
         cid = chat_id or self._chat_id
         if not cid:
             return None
-        return self._request("get", f"/chats/{cid}")
+
+        etag = self._chat_etag.get(cid)
+        headers = {**self._json_headers, "If-None-Match": etag} if etag else self._json_headers
+
+        resp = self._get_session().get(f"{self._base_url}/chats/{cid}", headers=headers, timeout=30)
+        if resp.status_code == 304:
+            return self._chat_cache.get(cid)
+
+        data = self._parse_response(resp)
+        new_etag = resp.headers.get("ETag")
+        if new_etag:
+            self._chat_etag[cid] = new_etag
+            self._chat_cache[cid] = data
+        return data
     
     def stop_chat(self) -> None:
         """Stop the current chat generation."""
@@ -181,7 +384,14 @@ class Agent:
         """
         Stream messages from the current chat with auto-reconnect.
         Uses the unified stream endpoint with TypedEvents.
-        
+
+        Note:
+            Each stream holds one long-lived HTTP/1.1 SSE connection. When
+            running many streams concurrently, front the API with an
+            HTTP/2-capable proxy (or terminate TLS once at a gateway) so the
+            streams multiplex over a single TCP/TLS session instead of
+            opening a socket per stream.
+
         Args:
             auto_reconnect: Whether to automatically reconnect on connection loss
             max_reconnects: Maximum number of reconnection attempts
@@ -192,44 +402,25 @@ class Agent:
         """
         if not self._chat_id:
             raise RuntimeError("No active chat - send a message first")
-        
-        from queue import Queue
-        import threading
-        
-        message_queue: Queue[ChatMessageDTO | Exception | None] = Queue()
-        
+
         def create_event_source():
             # Use unified stream with TypedEvents
             return self._create_typed_sse_generator(f"/chats/{self._chat_id}/stream")
-        
-        def handle_event(event_tuple):
-            event_type, data = event_tuple
-            # Only yield chat_messages events
-            if event_type == "chat_messages":
-                message_queue.put(data)
-        
+
+        # The caller drives the iteration, so stream directly via
+        # iter_events() - no background thread or queue hop per event.
         manager = StreamManager(
             create_event_source=create_event_source,
             auto_reconnect=auto_reconnect,
             max_reconnects=max_reconnects,
             reconnect_delay_ms=reconnect_delay_ms,
-            on_data=handle_event,
-            on_error=lambda err: message_queue.put(err),
-            on_stop=lambda: message_queue.put(None),
         )
-        
-        # Run in background thread
-        thread = threading.Thread(target=manager.connect, daemon=True)
-        thread.start()
-        
+
         try:
-            while True:
-                item = message_queue.get()
-                if item is None:
-                    break
-                if isinstance(item, Exception):
-                    raise item
-                yield item
+            for event_type, data in manager.iter_events():
+                # Only yield chat_messages events
+                if event_type == "chat_messages":
+                    yield data
         finally:
             manager.stop()
     
@@ -253,43 +444,23 @@ class Agent:
         """
         if not self._chat_id:
             raise RuntimeError("No active chat - send a message first")
-        
-        from queue import Queue
-        import threading
-        
-        chat_queue: Queue[ChatDTO | Exception | None] = Queue()
-        
+
         def create_event_source():
             # Use unified stream with TypedEvents
             return self._create_typed_sse_generator(f"/chats/{self._chat_id}/stream")
-        
-        def handle_event(event_tuple):
-            event_type, data = event_tuple
-            # Only yield chats events
-            if event_type == "chats":
-                chat_queue.put(data)
-        
+
         manager = StreamManager(
             create_event_source=create_event_source,
             auto_reconnect=auto_reconnect,
             max_reconnects=max_reconnects,
             reconnect_delay_ms=reconnect_delay_ms,
-            on_data=handle_event,
-            on_error=lambda err: chat_queue.put(err),
-            on_stop=lambda: chat_queue.put(None),
         )
-        
-        thread = threading.Thread(target=manager.connect, daemon=True)
-        thread.start()
-        
+
         try:
-            while True:
-                item = chat_queue.get()
-                if item is None:
-                    break
-                if isinstance(item, Exception):
-                    raise item
-                yield item
+            for event_type, data in manager.iter_events():
+                # Only yield chats events
+                if event_type == "chats":
+                    yield data
         finally:
             manager.stop()
     
@@ -326,72 +497,149 @@ class Agent:
                     on_message(data)
                 
                 # Check for client tool invocations awaiting input
-                # (ID tracking handles duplicates, status field indicates message readiness)
                 if on_tool_call:
-                    for inv in data.get("tool_invocations") or []:
-                        inv_id = inv.get("id")
-                        if not inv_id or inv_id in self._dispatched_tools:
-                            continue
-                        if inv.get("type") == ToolType.CLIENT and inv.get("status") == ToolInvocationStatus.AWAITING_INPUT:
-                            self._dispatched_tools.add(inv_id)
-                            on_tool_call(ToolCallInfo(
-                                id=inv_id,
-                                name=inv.get("function", {}).get("name", ""),
-                                args=inv.get("function", {}).get("arguments", {}),
-                            ))
+                    for call in _pending_tool_calls(data, self._dispatched_tools):
+                        on_tool_call(call)
     
     def reset(self) -> None:
         """Reset the agent (start fresh chat)."""
         self._chat_id = None
         self._dispatched_tools.clear()
+        self._last_event_id = None
     
-    def upload_file(self, data: bytes | str) -> Dict[str, Any]:
+    def upload_file(self, data: bytes | str | Path | BinaryIO) -> Dict[str, Any]:
         """
         Upload a file and return the file object.
-        
+
         Args:
-            data: File data (bytes, base64 string, or data URI)
-            
+            data: File data (bytes, base64 string, data URI, filesystem
+                path, or binary file object). Paths and file objects are
+                streamed to the signed URL without loading the file into
+                memory.
+
         Returns:
             Dict with 'uri' and 'content_type'
         """
-        import base64
-        
-        requests = _require_requests()
-        
-        # Determine content type and convert to bytes
+        return self.upload_files([data])[0]
+
+    def upload_files(self, files: list[bytes | str | Path | BinaryIO]) -> list[Dict[str, Any]]:
+        """
+        Upload several files and return their file objects, in input order.
+
+        All file records are created with a single /files request, and the
+        signed-URL uploads run in parallel - N files cost roughly one
+        metadata round-trip plus the longest individual upload, instead of
+        2N serialized round-trips.
+
+        Args:
+            files: File data items (bytes, base64 strings, or data URIs)
+
+        Returns:
+            List of dicts with 'uri' and 'content_type'
+        """
+        prepared = [self._prepare_file(f) for f in files]
+
+        # Create all file records in one round-trip
+        file_req = {"files": [{"uri": "", "content_type": ct, "size": size} for ct, size, _ in prepared]}
+        created = self._request("post", "/files", data=file_req)
+        if len(created) != len(prepared):
+            # zip() below would silently drop files past the shorter list
+            raise RuntimeError(
+                f"/files returned {len(created)} records for {len(prepared)} files"
+            )
+
+        def _upload(file_obj: Dict[str, Any], content_type: str, body: Any) -> Dict[str, Any]:
+            upload_url = file_obj.get("upload_url")
+            if not upload_url:
+                raise RuntimeError("No upload URL")
+            self._put_signed(upload_url, body, content_type)
+            return {"uri": file_obj["uri"], "content_type": file_obj.get("content_type")}
+
+        if len(prepared) == 1:
+            ct, _, body = prepared[0]
+            return [_upload(created[0], ct, body)]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(6, len(prepared))) as pool:
+            futures = [
+                pool.submit(_upload, file_obj, ct, body)
+                for file_obj, (ct, _, body) in zip(created, prepared)
+            ]
+            return [f.result() for f in futures]
+
+    def _prepare_file(self, data: bytes | str | Path | BinaryIO) -> tuple[str, int, Any]:
+        """Normalize one attachment to (content_type, size, body).
+
+        body is either bytes, a Path, or a seekable binary file object;
+        Path/file bodies are streamed at PUT time rather than read into
+        memory here.
+        """
         content_type = "application/octet-stream"
-        raw_bytes: bytes
-        
+
         if isinstance(data, bytes):
-            raw_bytes = data
-        elif data.startswith("data:"):
+            return content_type, len(data), data
+        if isinstance(data, Path):
+            # Metadata from the filesystem - no need to open the file here
+            guessed = mimetypes.guess_type(data.name)[0]
+            return guessed or content_type, os.stat(data).st_size, data
+        if hasattr(data, "read"):
+            # Binary file object - size from the underlying descriptor,
+            # falling back to seek/tell for in-memory buffers
+            try:
+                size = os.fstat(data.fileno()).st_size
+            except (OSError, AttributeError):
+                pos = data.tell()
+                data.seek(0, os.SEEK_END)
+                size = data.tell()
+                data.seek(pos)
+            return content_type, size, data
+        if data.startswith("data:"):
             # Data URI
-            import re
-            match = re.match(r"^data:([^;]+);base64,(.+)$", data)
+            match = _DATA_URI_RE.match(data)
             if not match:
                 raise ValueError("Invalid data URI")
             content_type = match.group(1)
-            raw_bytes = base64.b64decode(match.group(2))
+            # The regex already isolated the payload, so decode with the
+            # binascii primitive instead of b64decode's extra scan
+            raw_bytes = binascii.a2b_base64(match.group(2).encode("ascii"))
+            return content_type, len(raw_bytes), raw_bytes
+        # Assume base64 - decode in chunks into a spooled temp file so the
+        # full decoded payload never has to sit in memory alongside the
+        # encoded string
+        spooled, size = self._spool_base64(data)
+        return content_type, size, spooled
+
+    @staticmethod
+    def _spool_base64(data: str) -> tuple[BinaryIO, int]:
+        """Decode a base64 string into a spooled temp file, 64 KiB at a time."""
+        import tempfile
+
+        spooled = tempfile.SpooledTemporaryFile(max_size=4 * 1024 * 1024)
+        # Producers commonly wrap base64 at 76 columns (MIME,
+        # base64.encodebytes); strip whitespace first so the fixed-size
+        # slices below stay 4-character aligned
+        data = "".join(data.split())
+        # Chunk on a multiple of 4 so each slice decodes independently
+        chunk = 64 * 1024
+        for start in range(0, len(data), chunk):
+            spooled.write(binascii.a2b_base64(data[start:start + chunk]))
+        size = spooled.tell()
+        spooled.seek(0)
+        return spooled, size
+
+    def _put_signed(self, upload_url: str, body: Any, content_type: str) -> None:
+        """PUT an attachment body (bytes, Path, or file object) to a signed URL."""
+        headers = {"Content-Type": content_type}
+        if isinstance(body, Path):
+            with open(body, "rb") as fh:
+                resp = self._get_session().put(upload_url, data=fh, headers=headers)
         else:
-            # Assume base64
-            raw_bytes = base64.b64decode(data)
-        
-        # Create file record
-        file_req = {"files": [{"uri": "", "content_type": content_type, "size": len(raw_bytes)}]}
-        created = self._request("post", "/files", data=file_req)
-        file_obj = created[0]
-        
-        upload_url = file_obj.get("upload_url")
-        if not upload_url:
-            raise RuntimeError("No upload URL")
-        
-        # Upload to signed URL
-        resp = requests.put(upload_url, data=raw_bytes, headers={"Content-Type": content_type})
+            if hasattr(body, "seek"):
+                body.seek(0)
+            resp = self._get_session().put(upload_url, data=body, headers=headers)
         if not resp.ok:
             raise RuntimeError("Upload failed")
-        
-        return {"uri": file_obj["uri"], "content_type": file_obj.get("content_type")}
     
     # =========================================================================
     # Private Methods
@@ -399,63 +647,30 @@ class Agent:
     
     def _create_sse_generator(self, endpoint: str):
         """Create an SSE generator for StreamManager."""
-        requests = _require_requests()
-        
         url = f"{self._base_url}{endpoint}"
-        headers = {
-            "Authorization": f"Bearer {self._api_key}",
-            "Accept": "text/event-stream",
-        }
-        
-        resp = requests.get(url, headers=headers, stream=True, timeout=60)
-        
-        def generator():
-            for line in resp.iter_lines(decode_unicode=True):
-                if not line or line.startswith(":"):
-                    continue
-                if line.startswith("data:"):
-                    data_str = line[5:].strip()
-                    if data_str:
-                        try:
-                            yield json.loads(data_str)
-                        except json.JSONDecodeError:
-                            continue
-        
-        return generator()
+        if self._last_event_id:
+            # Resume from where the previous connection dropped instead of
+            # replaying the backlog
+            headers = {**self._sse_headers, "Last-Event-ID": self._last_event_id}
+        else:
+            headers = self._sse_headers
+
+        resp = self._get_session().get(url, headers=headers, stream=True, timeout=60)
+        return _iter_sse_data(resp.iter_lines(), on_id=self._set_last_event_id)
     
     def _create_typed_sse_generator(self, endpoint: str):
         """Create an SSE generator that yields (event_type, data) tuples for TypedEvents."""
-        requests = _require_requests()
-        
         url = f"{self._base_url}{endpoint}"
-        headers = {
-            "Authorization": f"Bearer {self._api_key}",
-            "Accept": "text/event-stream",
-        }
-        
-        resp = requests.get(url, headers=headers, stream=True, timeout=60)
-        
-        def generator():
-            current_event_type: Optional[str] = None
-            for line in resp.iter_lines(decode_unicode=True):
-                if not line:
-                    current_event_type = None  # Reset on empty line (event boundary)
-                    continue
-                if line.startswith(":"):
-                    continue
-                if line.startswith("event:"):
-                    current_event_type = line[6:].strip()
-                    continue
-                if line.startswith("data:"):
-                    data_str = line[5:].strip()
-                    if data_str:
-                        try:
-                            data = json.loads(data_str)
-                            yield (current_event_type or "message", data)
-                        except json.JSONDecodeError:
-                            continue
-        
-        return generator()
+        if self._last_event_id:
+            headers = {**self._sse_headers, "Last-Event-ID": self._last_event_id}
+        else:
+            headers = self._sse_headers
+
+        resp = self._get_session().get(url, headers=headers, stream=True, timeout=60)
+        return _iter_typed_sse(resp.iter_lines(), on_id=self._set_last_event_id)
+
+    def _set_last_event_id(self, event_id: str) -> None:
+        self._last_event_id = event_id
     
     def _start_streaming(
         self,
@@ -470,13 +685,39 @@ class Agent:
         """
         if not self._chat_id:
             return
-        
-        # Run synchronously - stream_all blocks until the chat completes
-        # Callbacks are invoked inline as events arrive
+
+        # Dispatch callbacks on the single-worker pool so the SSE reader
+        # keeps draining the socket while user code runs. Ordering is
+        # preserved (one worker); callback exceptions surface after the
+        # stream completes rather than aborting it mid-flight. Only the
+        # most recent future and the first failure are kept - retaining
+        # every future would grow memory for the life of the stream.
+        pool = self._get_cb_pool()
+        state = {"last": None, "error": None}
+
+        def _dispatched(cb):
+            def run(arg):
+                try:
+                    cb(arg)
+                except Exception as e:
+                    if state["error"] is None:
+                        state["error"] = e
+
+            def dispatch(arg):
+                state["last"] = pool.submit(run, arg)
+            return dispatch
+
         self.stream_all(
-            on_message=on_message,
-            on_tool_call=on_tool_call,
+            on_message=_dispatched(on_message) if on_message else None,
+            on_tool_call=_dispatched(on_tool_call) if on_tool_call else None,
         )
+
+        # The worker runs FIFO, so joining the last future waits for all
+        # queued callbacks; then propagate the first failure
+        if state["last"] is not None:
+            state["last"].result()
+        if state["error"] is not None:
+            raise state["error"]
     
     def _request(
         self,
@@ -485,44 +726,41 @@ class Agent:
         data: Optional[Dict[str, Any]] = None,
     ) -> Any:
         """Make an API request."""
-        requests = _require_requests()
-        
         url = f"{self._base_url}{endpoint}"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self._api_key}",
-        }
-        
-        resp = requests.request(
+
+        resp = self._get_session().request(
             method=method.upper(),
             url=url,
-            headers=headers,
-            data=json.dumps(data) if data else None,
+            headers=self._json_headers,
+            data=_json_dumps(data) if data else None,
             timeout=30,
         )
-        
-        # Try to parse JSON response
+        return self._parse_response(resp)
+
+    @staticmethod
+    def _parse_response(resp) -> Any:
+        """Unwrap a {success, data, error} API response, raising on failure."""
         payload = {}
         if resp.text:
             try:
-                payload = json.loads(resp.text)
-            except json.JSONDecodeError:
+                payload = _json_loads(resp.text)
+            except _JSONDecodeError:
                 # Some endpoints may return non-JSON (e.g., plain "true")
                 # If response is OK, treat as success with no data
                 if resp.ok:
                     return None
                 raise RuntimeError(f"Invalid response: {resp.text[:200]}")
-        
+
         if not resp.ok:
             error = payload.get("error", {})
             msg = error.get("message") if isinstance(error, dict) else str(error)
             raise RuntimeError(msg or f"Request failed: {resp.status_code}")
-        
+
         if not payload.get("success"):
             error = payload.get("error", {})
             msg = error.get("message") if isinstance(error, dict) else str(error)
             raise RuntimeError(msg or "Request failed")
-        
+
         return payload.get("data")
 
 
@@ -537,21 +775,68 @@ class AsyncAgent:
         self._api_key = config.api_key
         self._base_url = config.base_url
         self._options = options
+        self._options_key = _agent_key(options)
         self._chat_id: Optional[str] = None
-    
+        self._json_headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self._api_key}",
+        }
+        self._sse_headers = {
+            "Authorization": f"Bearer {self._api_key}",
+            "Accept": "text/event-stream",
+        }
+        self._session = None  # lazily-created aiohttp.ClientSession, shared across calls
+        self._session_lock = None  # created on first use (needs a running loop)
+        self._last_event_id: Optional[str] = None  # resume point for SSE reconnects
+        # Conditional-GET cache for get_chat: etag + last body per chat id
+        self._chat_etag: dict[str, str] = {}
+        self._chat_cache: dict[str, ChatDTO] = {}
+
     @property
     def chat_id(self) -> Optional[str]:
         return self._chat_id
+
+    async def _get_session(self):
+        """Get the shared aiohttp session, creating it on first use.
+
+        One session per instance reuses connections (and their TLS state)
+        across requests and streams instead of building a new connector,
+        resolver, and cookie jar per call.
+        """
+        aiohttp = await _require_aiohttp()
+        if self._session_lock is None:
+            self._session_lock = asyncio.Lock()
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                self._session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(
+                        limit=32,
+                        limit_per_host=16,
+                        ttl_dns_cache=300,
+                        keepalive_timeout=30,
+                    ),
+                    # Keep any json= call sites fast too, even though
+                    # _request pre-serializes with _json_dumps itself
+                    json_serialize=lambda obj: _json_dumps(obj).decode(),
+                )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP session and its connection pool."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "AsyncAgent":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
     
     async def send_message(self, text: str) -> ChatMessageDTO:
         """Send a message to the agent."""
-        # Build request body - /agents/run accepts either "agent" (template ref) or "agent_config" (ad-hoc)
-        input_data = {"text": text, "role": "user", "context": [], "system_prompt": "", "context_size": 0}
-        if isinstance(self._options, str):
-            body = {"chat_id": self._chat_id, "agent": self._options, "input": input_data}
-        else:
-            body = {"chat_id": self._chat_id, "agent_config": self._options, "input": input_data}
-        
+        body = _build_body(self._options_key, self._options, self._chat_id, text)
+
         response = await self._request("post", "/agents/run", data=body)
         
         assistant_msg = response.get("assistant_message", {})
@@ -561,10 +846,34 @@ class AsyncAgent:
         return assistant_msg
     
     async def get_chat(self, chat_id: Optional[str] = None) -> Optional[ChatDTO]:
+        """Get chat by ID, using If-None-Match to skip unchanged bodies."""
         cid = chat_id or self._chat_id
         if not cid:
             return None
-        return await self._request("get", f"/chats/{cid}")
+
+        etag = self._chat_etag.get(cid)
+        headers = {**self._json_headers, "If-None-Match": etag} if etag else self._json_headers
+
+        session = await self._get_session()
+        async with session.get(f"{self._base_url}/chats/{cid}", headers=headers) as resp:
+            if resp.status == 304:
+                return self._chat_cache.get(cid)
+
+            if resp.content_type == "application/json":
+                payload = _json_loads(await resp.read())
+            else:
+                payload = {}
+            if not resp.ok or not payload.get("success"):
+                error = payload.get("error", {})
+                msg = error.get("message") if isinstance(error, dict) else str(error)
+                raise RuntimeError(msg or "Request failed")
+
+            data = payload.get("data")
+            new_etag = resp.headers.get("ETag")
+            if new_etag:
+                self._chat_etag[cid] = new_etag
+                self._chat_cache[cid] = data
+            return data
     
     async def stop_chat(self) -> None:
         if self._chat_id:
@@ -592,14 +901,68 @@ class AsyncAgent:
             result = json.dumps(result_or_action)
         await self._request("post", f"/tools/{tool_invocation_id}", data={"result": result})
     
-    async def stream_messages(self) -> AsyncIterator[ChatMessageDTO]:
-        """Stream messages from the unified stream endpoint with TypedEvents."""
+    async def stream_messages(
+        self,
+        max_buffered: int = 256,
+        overflow: str = "block",
+    ) -> AsyncIterator[ChatMessageDTO]:
+        """Stream messages from the unified stream endpoint with TypedEvents.
+
+        A background task reads the SSE stream into a bounded queue, so a
+        slow consumer can't grow an unbounded buffer of pending messages.
+
+        Args:
+            max_buffered: Maximum messages held between network read and
+                the caller's iteration.
+            overflow: What the reader does when the buffer is full -
+                "block" (default) stops reading so backpressure reaches
+                the server via TCP, "drop_oldest" discards the oldest
+                buffered message and keeps reading.
+
+        Yields:
+            ChatMessageDTO: Message updates
+        """
         if not self._chat_id:
             raise RuntimeError("No active chat - send a message first")
-        
-        async for event_type, data in self._stream_typed_sse(f"/chats/{self._chat_id}/stream"):
-            if event_type == "chat_messages":
-                yield data
+        if overflow not in ("block", "drop_oldest"):
+            raise ValueError('overflow must be "block" or "drop_oldest"')
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_buffered)
+        done = object()
+
+        async def producer() -> None:
+            try:
+                async for event_type, data in self._stream_typed_sse(f"/chats/{self._chat_id}/stream"):
+                    if event_type != "chat_messages":
+                        continue
+                    if overflow == "block":
+                        await queue.put(data)
+                    else:
+                        while True:
+                            try:
+                                queue.put_nowait(data)
+                                break
+                            except asyncio.QueueFull:
+                                try:
+                                    queue.get_nowait()
+                                except asyncio.QueueEmpty:
+                                    pass
+            except Exception as exc:  # noqa: BLE001 - forwarded to the consumer
+                await queue.put(exc)
+            else:
+                await queue.put(done)
+
+        task = asyncio.create_task(producer())
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            task.cancel()
     
     async def stream_chat(self) -> AsyncIterator[ChatDTO]:
         """Stream chat updates from the unified stream endpoint with TypedEvents."""
@@ -612,82 +975,87 @@ class AsyncAgent:
     
     def reset(self) -> None:
         self._chat_id = None
+        self._last_event_id = None
     
     async def _request(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Any:
-        aiohttp = await _require_aiohttp()
-        
         url = f"{self._base_url}{endpoint}"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self._api_key}",
-        }
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.request(method.upper(), url, headers=headers, json=data) as resp:
-                payload = await resp.json() if resp.content_type == "application/json" else {}
-                
-                if not resp.ok or not payload.get("success"):
-                    error = payload.get("error", {})
-                    msg = error.get("message") if isinstance(error, dict) else str(error)
-                    raise RuntimeError(msg or "Request failed")
-                
-                return payload.get("data")
+
+        session = await self._get_session()
+        body = _json_dumps(data) if data is not None else None
+        async with session.request(method.upper(), url, headers=self._json_headers, data=body) as resp:
+            if resp.content_type == "application/json":
+                payload = _json_loads(await resp.read())
+            else:
+                payload = {}
+
+            if not resp.ok or not payload.get("success"):
+                error = payload.get("error", {})
+                msg = error.get("message") if isinstance(error, dict) else str(error)
+                raise RuntimeError(msg or "Request failed")
+
+            return payload.get("data")
     
     async def _stream_sse(self, endpoint: str) -> AsyncIterator[Dict[str, Any]]:
         """Stream SSE events (yields raw data without event type)."""
-        aiohttp = await _require_aiohttp()
-        
         url = f"{self._base_url}{endpoint}"
-        headers = {
-            "Authorization": f"Bearer {self._api_key}",
-            "Accept": "text/event-stream",
-        }
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as resp:
-                async for line in resp.content:
-                    line_str = line.decode().strip()
-                    if not line_str or line_str.startswith(":"):
-                        continue
-                    if line_str.startswith("data:"):
-                        data_str = line_str[5:].strip()
-                        if data_str:
-                            try:
-                                yield json.loads(data_str)
-                            except json.JSONDecodeError:
-                                continue
+        if self._last_event_id:
+            headers = {**self._sse_headers, "Last-Event-ID": self._last_event_id}
+        else:
+            headers = self._sse_headers
+
+        session = await self._get_session()
+        async with session.get(url, headers=headers) as resp:
+            async for raw in resp.content:
+                line = raw.rstrip(b"\r\n")
+                if not line or line[:1] == b":":
+                    continue
+                if line.startswith(b"id:"):
+                    self._last_event_id = line[3:].strip().decode()
+                    continue
+                if line.startswith(b"data:"):
+                    payload = line[5:]
+                    if payload[:1] == b" ":
+                        payload = payload[1:]
+                    if payload:
+                        try:
+                            yield _json_loads(payload)
+                        except _JSONDecodeError:
+                            continue
     
     async def _stream_typed_sse(self, endpoint: str) -> AsyncIterator[tuple[str, Dict[str, Any]]]:
         """Stream SSE events with TypedEvents (yields event_type, data tuples)."""
-        aiohttp = await _require_aiohttp()
-        
         url = f"{self._base_url}{endpoint}"
-        headers = {
-            "Authorization": f"Bearer {self._api_key}",
-            "Accept": "text/event-stream",
-        }
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as resp:
-                current_event_type: Optional[str] = None
-                async for line in resp.content:
-                    line_str = line.decode().strip()
-                    if not line_str:
-                        current_event_type = None  # Reset on empty line (event boundary)
-                        continue
-                    if line_str.startswith(":"):
-                        continue
-                    if line_str.startswith("event:"):
-                        current_event_type = line_str[6:].strip()
-                        continue
-                    if line_str.startswith("data:"):
-                        data_str = line_str[5:].strip()
-                        if data_str:
-                            try:
-                                data = json.loads(data_str)
-                                yield (current_event_type or "message", data)
-                            except json.JSONDecodeError:
-                                continue
+        if self._last_event_id:
+            headers = {**self._sse_headers, "Last-Event-ID": self._last_event_id}
+        else:
+            headers = self._sse_headers
+
+        session = await self._get_session()
+        async with session.get(url, headers=headers) as resp:
+            current_event_type: Optional[str] = None
+            async for raw in resp.content:
+                line = raw.rstrip(b"\r\n")
+                if not line:
+                    current_event_type = None  # Reset on empty line (event boundary)
+                    continue
+                if line[:1] == b":":
+                    continue
+                if line.startswith(b"id:"):
+                    self._last_event_id = line[3:].strip().decode()
+                    continue
+                if line.startswith(b"event:"):
+                    current_event_type = line[6:].strip().decode()
+                    continue
+                if line.startswith(b"data:"):
+                    payload = line[5:]
+                    if payload[:1] == b" ":
+                        payload = payload[1:]
+                    if payload:
+                        try:
+                            data = _json_loads(payload)
+                            yield (current_event_type or "message", data)
+                        except _JSONDecodeError:
+                            continue
 
 
 # =============================================================================
@@ -14,7 +14,11 @@ from .models.errors import APIError, RequirementsNotMetError
 from .types import TaskStatus, ChatMessageStatus
 
 # Terminal statuses where a task is considered "done"
-TERMINAL_STATUSES = {TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED}
+TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED})
+
+# Non-terminal message statuses; str-enum members hash like their values,
+# so this covers both ChatMessageStatus.PENDING and the raw "pending" string
+_PENDING_STATUSES = frozenset({ChatMessageStatus.PENDING.value})
 
 
 def is_terminal_status(status: int) -> bool:
@@ -37,7 +41,7 @@ def is_message_ready(status: str | None) -> bool:
     """
     if not status:
         return False
-    return status not in (ChatMessageStatus.PENDING, ChatMessageStatus.PENDING.value)
+    return status not in _PENDING_STATUSES
 
 
 if TYPE_CHECKING:
@@ -286,6 +290,50 @@ class StreamManager:
         if self._on_stop:
             self._on_stop()
 
+    def iter_events(self) -> Iterator[Any]:
+        """Yield events directly, reconnecting per the manager's settings.
+
+        Single-threaded alternative to connect() for callers that iterate
+        themselves: no callback dispatch, no queue hop, no background
+        thread - each event goes straight from the event source to the
+        caller's loop. Iteration ends when stop() is called, the source
+        completes with auto-reconnect off, or the stream never connected
+        and reconnect attempts are exhausted (the last error is raised).
+        """
+        self._stopped = False
+        self._reconnect_attempts = 0
+        while not self._stopped:
+            try:
+                event_source = self._create_event_source()
+                try:
+                    for data in event_source:
+                        if self._stopped:
+                            break
+                        self._had_successful_connection = True
+                        yield data
+                        if self._stopped:
+                            break
+                finally:
+                    if hasattr(event_source, 'close'):
+                        event_source.close()
+
+                if self._stopped or not self._auto_reconnect:
+                    break
+            except Exception as exc:  # noqa: BLE001
+                if self._on_error:
+                    self._on_error(exc)
+                if self._stopped:
+                    break
+                if not self._had_successful_connection:
+                    self._reconnect_attempts += 1
+                    if self._reconnect_attempts > self._max_reconnects:
+                        raise
+                time.sleep(self._reconnect_delay_ms / 1000.0)
+            else:
+                if not self._auto_reconnect:
+                    break
+                time.sleep(self._reconnect_delay_ms / 1000.0)
+
     def connect(self) -> None:
         self._stopped = False
         self._reconnect_attempts = 0
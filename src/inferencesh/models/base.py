@@ -1,8 +1,5 @@
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, ConfigDict, Field
-import inspect
-import ast
-import textwrap
 from collections import OrderedDict
 from inferencesh.models.file import File
 from inferencesh.models.output_meta import OutputMeta
@@ -10,18 +7,22 @@ from inferencesh.models.output_meta import OutputMeta
 
 class Metadata(BaseModel):
     """Runtime metadata passed to app setup and run methods."""
+    model_config = ConfigDict(extra="allow")
+
     app_id: Optional[str] = None
     app_version_id: Optional[str] = None
     app_variant: Optional[str] = None
     worker_id: Optional[str] = None
     
     def update(self, other: Dict[str, Any] | BaseModel) -> None:
-        update_dict = other.model_dump() if isinstance(other, BaseModel) else other
-        for key, value in update_dict.items():
-            setattr(self, key, value)
-    
-    class Config:
-        extra = "allow"
+        if isinstance(other, BaseModel):
+            # Copy only explicitly-set fields, skipping the model_dump
+            # round-trip and leaving our defaults in place
+            for key in other.model_fields_set:
+                setattr(self, key, getattr(other, key))
+        else:
+            for key, value in other.items():
+                setattr(self, key, value)
 
 
 class OrderedSchemaModel(BaseModel):
@@ -29,6 +30,23 @@ class OrderedSchemaModel(BaseModel):
 
     @classmethod
     def model_json_schema(cls, by_alias: bool = True, **kwargs: Any) -> Dict[str, Any]:
+        # Memoize per concrete class (cls.__dict__, not inherited) - the
+        # schema is deterministic for a given class and arguments, and
+        # callers like schema generation request it repeatedly. Callers
+        # must treat the returned dict as read-only.
+        try:
+            cache_key = (by_alias, tuple(sorted(kwargs.items())))
+        except TypeError:
+            cache_key = None
+        if cache_key is not None:
+            cache = cls.__dict__.get('_schema_cache')
+            if cache is None:
+                cache = {}
+                cls._schema_cache = cache
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         schema = super().model_json_schema(by_alias=by_alias, **kwargs)
 
         field_order = cls._get_field_order()
@@ -54,38 +72,18 @@ class OrderedSchemaModel(BaseModel):
                 ordered_required.extend([field for field in schema['required'] if field not in ordered_required])
                 schema['required'] = ordered_required
 
+        if cache_key is not None:
+            cache[cache_key] = schema
         return schema
 
     @classmethod
     def _get_field_order(cls) -> List[str]:
-        """Get the order of fields as they were defined in the class."""
-        source = inspect.getsource(cls)
-
-        # Unindent the entire source code
-        source = textwrap.dedent(source)
+        """Get the order of fields as they were defined in the class.
 
-        try:
-            module = ast.parse(source)
-        except IndentationError:
-            # If we still get an IndentationError, wrap the class in a dummy module
-            source = f"class DummyModule:\n{textwrap.indent(source, '    ')}"
-            module = ast.parse(source)
-            # Adjust to look at the first class def inside DummyModule
-            # noinspection PyUnresolvedReferences
-            class_def = module.body[0].body[0]
-        else:
-            # Find the class definition
-            class_def = next(
-                node for node in module.body if isinstance(node, ast.ClassDef) and node.name == cls.__name__
-            )
-
-        # Extract field names in the order they were defined
-        field_order = []
-        for node in class_def.body:
-            if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
-                field_order.append(node.target.id)
-
-        return field_order
+        Pydantic already preserves definition order (inherited fields
+        first) in model_fields, so no source parsing is needed.
+        """
+        return list(cls.model_fields.keys())
 
 class BaseAppSetup(OrderedSchemaModel):
     pass
@@ -1,14 +1,199 @@
 from typing import Optional, Union, Any
 from pydantic import BaseModel, Field, PrivateAttr, model_validator, GetJsonSchemaHandler
 from pydantic_core import CoreSchema
+import contextvars
+import functools
 import mimetypes
 import os
+import shutil
+import sys
 import urllib.request
+import weakref
 import urllib.parse
 import hashlib
 from pathlib import Path
 from tqdm import tqdm
 
+
+# Load the mimetypes database once at import instead of lazily on the
+# first guess_type call.
+mimetypes.init()
+
+
+# Two-tier MIME lookup: the extensions that cover nearly all web content
+# are resolved from this frozen table; everything else falls through to
+# the full mimetypes database.
+_FAST_MIME = {
+    '.html': 'text/html',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.json': 'application/json',
+    '.mp4': 'video/mp4',
+    '.mp3': 'audio/mpeg',
+    '.wav': 'audio/x-wav',
+    '.zip': 'application/zip',
+    '.pdf': 'application/pdf',
+    '.webm': 'video/webm',
+    '.gif': 'image/gif',
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _guess_by_ext(ext: str) -> Optional[str]:
+    """Memoized MIME lookup keyed on a lowercased file extension."""
+    return _FAST_MIME.get(ext) or mimetypes.types_map.get(ext) or mimetypes.guess_type('x' + ext)[0]
+
+
+_POOLED_SESSION = None
+
+
+def _pooled_session():
+    """Shared requests.Session with a connection pool (created lazily).
+
+    Reusing one session amortizes TCP/TLS handshakes across downloads
+    when many Files are constructed in a batch.
+    """
+    global _POOLED_SESSION
+    if _POOLED_SESSION is None:
+        try:
+            import requests
+            from requests.adapters import HTTPAdapter
+        except ImportError:
+            raise RuntimeError(
+                "The 'requests' package is required for the pooled download "
+                "backend. Install it with: pip install requests"
+            )
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _POOLED_SESSION = session
+    return _POOLED_SESSION
+
+
+_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+    'AppleWebKit/537.36 (KHTML, like Gecko) '
+    'Chrome/91.0.4472.124 Safari/537.36'
+)
+
+# Ranged downloads: only worth the extra requests above this size, and
+# each worker fetches one shard at a time.
+_RANGED_MIN_SIZE = 64 * 1024 * 1024
+_RANGED_SHARD_SIZE = 8 * 1024 * 1024
+
+
+def _use_pooled_backend() -> bool:
+    """Whether downloads should go through the pooled requests session.
+
+    Opt-in via INFERENCESH_DL_BACKEND=requests (or "pooled"); the default
+    urllib path stays in place so environments without requests keep
+    working unchanged.
+    """
+    return os.environ.get("INFERENCESH_DL_BACKEND", "").lower() in ("requests", "pooled")
+
+
+# When set, model_post_init skips downloads and metadata population -
+# used by File.from_uris(validate=False) for trusted batch input.
+_RAW_CONSTRUCT = contextvars.ContextVar('inferencesh_file_raw_construct', default=False)
+
+
+def _revalidate_enabled() -> bool:
+    """Whether cached downloads should be revalidated with If-None-Match.
+
+    Opt-in via INFERENCESH_DL_REVALIDATE=1; by default cache hits are
+    served without touching the network.
+    """
+    return os.environ.get("INFERENCESH_DL_REVALIDATE", "").lower() in ("1", "true", "yes")
+
+
+def _write_etag(cache_path, etag: Optional[str]) -> None:
+    """Persist the ETag sidecar for a cached download (best effort)."""
+    if etag:
+        try:
+            Path(str(cache_path) + '.etag').write_text(etag)
+        except OSError:
+            pass
+
+
+def _unlink_quiet(path: str) -> None:
+    """Best-effort unlink used by temp-file finalizers."""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _download_chunk_size() -> int:
+    """Download block size in bytes (env override: INFERENCESH_DL_CHUNK)."""
+    try:
+        return int(os.environ.get("INFERENCESH_DL_CHUNK", 0)) or 1024 * 1024
+    except ValueError:
+        return 1024 * 1024
+
+
+class _NullBar:
+    """No-op progress bar for non-interactive (batch/server) contexts."""
+
+    def update(self, n):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+def _progress_bar(total_size: int):
+    """Return a tqdm bar on a TTY, a no-op bar otherwise.
+
+    Without a terminal every pbar.update is pure overhead in the hot
+    download loop; with one, mininterval caps redraws at 2/s.
+    """
+    if sys.stderr.isatty():
+        return tqdm(total=total_size, unit='iB', unit_scale=True, mininterval=0.5)
+    return _NullBar()
+
+
+class _ProgressReader:
+    """Read-through wrapper reporting bytes to a progress bar.
+
+    Lets shutil.copyfileobj drive the byte copy (a C loop) while still
+    feeding tqdm, with updates amortized to at most once per megabyte.
+    """
+
+    def __init__(self, raw, pbar):
+        self._raw = raw
+        self._pbar = pbar
+        self._unreported = 0
+        self._exhausted = False
+
+    def read(self, size=-1):
+        if self._exhausted:
+            return b''
+        try:
+            buffer = self._raw.read(size)
+        except TypeError:
+            # Some mocks (or minimal implementations) expose read() without size
+            buffer = self._raw.read()
+            self._exhausted = True
+        if buffer:
+            self._unreported += len(buffer)
+            if self._unreported >= 1024 * 1024:
+                self.flush_progress()
+        return buffer
+
+    def flush_progress(self):
+        if self._unreported:
+            try:
+                self._pbar.update(self._unreported)
+            except Exception:
+                pass
+            self._unreported = 0
+
+
 class File(BaseModel):
     """A class representing a file in the inference.sh ecosystem."""
     
@@ -22,7 +207,8 @@ class File(BaseModel):
         path.mkdir(parents=True, exist_ok=True)
         return path
     
-    def _get_cache_path(self, url: str) -> Path:
+    @classmethod
+    def _get_cache_path(cls, url: str) -> Path:
         """Get the cache path for a URL using a hash-based directory structure."""
         # Parse URL components
         parsed_url = urllib.parse.urlparse(url)
@@ -39,7 +225,7 @@ class File(BaseModel):
             filename = 'download'
             
         # Create hash directory in cache
-        cache_dir = self.get_cache_dir() / url_hash
+        cache_dir = cls.get_cache_dir() / url_hash
         cache_dir.mkdir(exist_ok=True)
         
         return cache_dir / filename
@@ -49,13 +235,20 @@ class File(BaseModel):
     size: Optional[int] = None  # File size in bytes
     filename: Optional[str] = None  # Original filename if available
     _tmp_path: Optional[str] = PrivateAttr(default=None)  # Internal storage for temporary file path
+    _finalizer: Optional[Any] = PrivateAttr(default=None)  # Cleans up _tmp_path if we die mid-download
     
     def __init__(self, initializer=None, **data):
         if initializer is not None:
             if isinstance(initializer, str):
+                # Hot path for batch inputs: a bare URI string
+                if not data:
+                    super().__init__(uri=initializer)
+                    return
                 data['uri'] = initializer
             elif isinstance(initializer, File):
-                data = initializer.model_dump()
+                # Copy field values directly instead of round-tripping
+                # through model_dump (which serializes nested values)
+                data = dict(initializer.__dict__)
             else:
                 raise ValueError(f'Invalid input for File: {initializer}')
         super().__init__(**data)
@@ -63,18 +256,14 @@ class File(BaseModel):
     @model_validator(mode='before')
     @classmethod
     def convert_str_to_file(cls, values):
+        """Normalize the input and require uri/path in a single pass."""
         if isinstance(values, str):  # Only accept strings
             return {"uri": values}
         elif isinstance(values, dict):
+            if not values.get('uri') and not values.get('path'):
+                raise ValueError("Either 'uri' or 'path' must be provided")
             return values
         raise ValueError(f'Invalid input for File: {values}')
-    
-    @model_validator(mode='after')
-    def validate_required_fields(self) -> 'File':
-        """Validate that either uri or path is provided."""
-        if not self.uri and not self.path:
-            raise ValueError("Either 'uri' or 'path' must be provided")
-        return self
 
     def model_post_init(self, _: Any) -> None:
         """Initialize file path and metadata after model creation.
@@ -84,17 +273,23 @@ class File(BaseModel):
         2. Converting relative paths to absolute paths
         3. Populating file metadata
         """
+        if _RAW_CONSTRUCT.get():
+            return
+
         # Handle uri if provided
         if self.uri:
             if self._is_url(self.uri):
                 self._download_url()
+            elif self.uri.startswith('file://'):
+                # Local file URI: resolve to the path directly - no bytes
+                # are copied, matching how plain local paths are handled
+                self.path = urllib.parse.unquote(urllib.parse.urlparse(self.uri).path)
             else:
-                # Convert relative paths to absolute, leave absolute paths unchanged
-                self.path = os.path.abspath(self.uri)
-        
-        # Handle path if provided
+                self.path = self.uri
+
+        # Handle path if provided; a single abspath covers both the
+        # uri-as-local-path case above and an explicitly passed path
         if self.path:
-            # Convert relative paths to absolute, leave absolute paths unchanged
             self.path = os.path.abspath(self.path)
             self._populate_metadata()
             return
@@ -102,37 +297,48 @@ class File(BaseModel):
         raise ValueError("Either 'uri' or 'path' must be provided and be valid")
 
     def _is_url(self, path: str) -> bool:
-        """Check if the path is a URL."""
-        parsed = urllib.parse.urlparse(path)
-        return parsed.scheme in ('http', 'https')
+        """Check if the path is a URL.
+
+        A prefix check replaces urlparse (regex plus namedtuple
+        allocation) with identical results for the accepted schemes.
+        """
+        return path.startswith(('http://', 'https://'))
 
     def _download_url(self) -> None:
         """Download the URL to the cache directory and update the path."""
         original_url = self.uri
         cache_path = self._get_cache_path(original_url)
         
-        # If file exists in cache, use it
+        # If file exists in cache, use it (optionally revalidating the
+        # cached copy against the server via its stored ETag)
         if cache_path.exists():
-            print(f"Using cached file: {cache_path}")
-            self.path = str(cache_path)
-            return
+            if not _revalidate_enabled() or self._cache_is_fresh(original_url, cache_path):
+                print(f"Using cached file: {cache_path}")
+                self.path = str(cache_path)
+                return
             
         print(f"Downloading URL: {original_url} to {cache_path}")
         try:
             # Download to a temporary filename in the final directory
             tmp_path = str(cache_path) + '.tmp'
             self._tmp_path = tmp_path
+            # Registered only when a temp file actually exists, so Files
+            # that never download pay no teardown cost
+            self._finalizer = weakref.finalize(self, _unlink_quiet, tmp_path)
             
             # Set up request with user agent
-            headers = {
-                'User-Agent': (
-                    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-                    'AppleWebKit/537.36 (KHTML, like Gecko) '
-                    'Chrome/91.0.4472.124 Safari/537.36'
-                )
-            }
+            headers = {'User-Agent': _USER_AGENT}
+            if _use_pooled_backend():
+                etag = self._download_pooled(original_url, headers)
+                os.rename(self._tmp_path, cache_path)
+                _write_etag(cache_path, etag)
+                self._detach_finalizer()
+                self._tmp_path = None
+                self.path = str(cache_path)
+                return
+
             req = urllib.request.Request(original_url, headers=headers)
-            
+
             # Download the file with progress bar
             print(f"Downloading URL: {original_url} to {self._tmp_path}")
             try:
@@ -150,32 +356,37 @@ class File(BaseModel):
                     except Exception:
                         total_size = 0
 
-                    block_size = 1024  # 1 Kibibyte
-                    
-                    with tqdm(total=total_size, unit='iB', unit_scale=True) as pbar:
-                        with open(self._tmp_path, 'wb') as out_file:
-                            while True:
-                                non_chunking = False
-                                try:
-                                    buffer = response.read(block_size)
-                                except TypeError:
-                                    # Some mocks (or minimal implementations) expose read() without size
-                                    buffer = response.read()
-                                    non_chunking = True
-                                if not buffer:
-                                    break
-                                out_file.write(buffer)
-                                try:
-                                    pbar.update(len(buffer))
-                                except Exception:
-                                    pass
-                                if non_chunking:
-                                    # If we read the whole body at once, exit loop
-                                    break
+                    try:
+                        etag = response.headers.get('etag')
+                    except Exception:
+                        etag = None
+
+                    block_size = _download_chunk_size()  # 1 MiB default
+
+                    out_fd = os.open(self._tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                    # Pre-size the file so the filesystem allocates extents
+                    # once instead of piecewise as writes extend it
+                    if total_size > 0 and hasattr(os, 'posix_fallocate'):
+                        try:
+                            os.posix_fallocate(out_fd, 0, total_size)
+                        except OSError:
+                            pass
+
+                    with _progress_bar(total_size) as pbar:
+                        with os.fdopen(out_fd, 'wb', buffering=8 * 1024 * 1024) as out_file:
+                            reader = _ProgressReader(response, pbar)
+                            shutil.copyfileobj(reader, out_file, block_size)
+                            reader.flush_progress()
+                            out_file.flush()
+                            # Trim any preallocated tail if the body was
+                            # shorter than content-length claimed
+                            os.ftruncate(out_fd, out_file.tell())
                             
                 # Rename the temporary file to the final name
                 os.rename(self._tmp_path, cache_path)
-                self._tmp_path = None  # Prevent deletion in __del__
+                _write_etag(cache_path, etag)
+                self._detach_finalizer()
+                self._tmp_path = None
                 self.path = str(cache_path)
             except (urllib.error.URLError, urllib.error.HTTPError) as e:
                 raise RuntimeError(f"Failed to download URL {original_url}: {str(e)}")
@@ -190,32 +401,251 @@ class File(BaseModel):
                     pass
             raise RuntimeError(f"Error downloading URL {original_url}: {str(e)}")
 
-    def __del__(self):
-        """Cleanup temporary file if it exists."""
-        if hasattr(self, '_tmp_path') and self._tmp_path:
-            try:
-                os.unlink(self._tmp_path)
-            except (OSError, IOError):
+    def _cache_is_fresh(self, url: str, cache_path: Path) -> bool:
+        """Check a cached download against the server with If-None-Match.
+
+        Returns True (serve the cached copy) when the server answers 304,
+        when no ETag was stored, or when the probe itself fails; a 200
+        means the content changed and triggers a re-download.
+        """
+        etag_path = Path(str(cache_path) + '.etag')
+        try:
+            etag = etag_path.read_text().strip()
+        except OSError:
+            return True  # nothing to validate against
+        req = urllib.request.Request(
+            url,
+            method='HEAD',
+            headers={'User-Agent': _USER_AGENT, 'If-None-Match': etag},
+        )
+        try:
+            with urllib.request.urlopen(req, timeout=30):
                 pass
+            return False  # 200: content changed upstream
+        except urllib.error.HTTPError as e:
+            return e.code == 304
+        except Exception:
+            return True  # network trouble: fall back to the cached copy
+
+    def _download_pooled(self, url: str, headers: dict) -> Optional[str]:
+        """Stream the URL to the temporary path via the shared pooled session.
+
+        Returns the response ETag, if the server sent one."""
+        session = _pooled_session()
+
+        # Large files on range-capable servers: fetch shards in parallel,
+        # which sidesteps per-connection TCP window limits.
+        try:
+            head = session.head(url, headers=headers, allow_redirects=True, timeout=60)
+            supports_ranges = head.headers.get('accept-ranges', '').lower() == 'bytes'
+            head_size = int(head.headers.get('content-length') or 0)
+        except Exception:
+            supports_ranges, head_size = False, 0
+        if supports_ranges and head_size >= _RANGED_MIN_SIZE:
+            if self._download_ranged(url, headers, head_size):
+                return head.headers.get('etag')
+
+        with session.get(url, headers=headers, stream=True, timeout=60) as response:
+            response.raise_for_status()
+            try:
+                total_size = int(response.headers.get('content-length') or 0)
+            except (TypeError, ValueError):
+                total_size = 0
+
+            block_size = _download_chunk_size()
+
+            with _progress_bar(total_size) as pbar:
+                with open(self._tmp_path, 'wb', buffering=8 * 1024 * 1024) as out_file:
+                    for buffer in response.iter_content(block_size):
+                        out_file.write(buffer)
+                        try:
+                            pbar.update(len(buffer))
+                        except Exception:
+                            pass
+            return response.headers.get('etag')
+
+    def _download_ranged(self, url: str, headers: dict, total_size: int) -> bool:
+        """Download the URL as parallel Range requests into the temporary path.
+
+        Returns True on success; False signals the caller to fall back to
+        the single-stream path (e.g. the server answered 200 instead of
+        206, meaning it ignored the Range header).
+        """
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        session = _pooled_session()
+        fd = os.open(self._tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(fd, 0, total_size)
+                except OSError:
+                    pass
+
+            lock = threading.Lock()
+            block_size = _download_chunk_size()
+
+            with _progress_bar(total_size) as pbar:
+                def fetch(start: int, end: int) -> None:
+                    range_headers = dict(headers)
+                    range_headers['Range'] = f'bytes={start}-{end}'
+                    with session.get(url, headers=range_headers, stream=True, timeout=60) as response:
+                        if response.status_code != 206:
+                            raise IOError(f"Server ignored Range request (HTTP {response.status_code})")
+                        offset = start
+                        for buffer in response.iter_content(block_size):
+                            os.pwrite(fd, buffer, offset)
+                            offset += len(buffer)
+                            with lock:
+                                try:
+                                    pbar.update(len(buffer))
+                                except Exception:
+                                    pass
+
+                shards = [
+                    (start, min(start + _RANGED_SHARD_SIZE, total_size) - 1)
+                    for start in range(0, total_size, _RANGED_SHARD_SIZE)
+                ]
+                with ThreadPoolExecutor(max_workers=min(8, len(shards))) as pool:
+                    futures = [pool.submit(fetch, start, end) for start, end in shards]
+                    for future in futures:
+                        future.result()
+            return True
+        except OSError:
+            # I/O and HTTP failures (requests exceptions subclass IOError,
+            # as does the explicit non-206 raise above) fall back to the
+            # single-stream path; anything else is a real bug and surfaces
+            return False
+        finally:
+            os.close(fd)
+
+    def _detach_finalizer(self) -> None:
+        """Drop the temp-file finalizer once the download is in place."""
+        if self._finalizer is not None:
+            self._finalizer.detach()
+            self._finalizer = None
 
     def _populate_metadata(self) -> None:
-        """Populate file metadata from the path if it exists."""
-        if os.path.exists(self.path):
-            if not self.content_type:
-                self.content_type = self._guess_content_type()
-            if not self.size:
-                self.size = self._get_file_size()
-            if not self.filename:
-                self.filename = self._get_filename()
+        """Populate file metadata from the path if it exists.
+
+        A single os.stat serves as both the existence probe and the size
+        lookup, halving VFS traversals per File.
+        """
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return
+        if not self.content_type:
+            self.content_type = self._guess_content_type()
+        if not self.size:
+            self.size = st.st_size
+        if not self.filename:
+            self.filename = self._get_filename()
     
     @classmethod
     def from_path(cls, path: Union[str, os.PathLike]) -> 'File':
         """Create a File instance from a file path."""
         return cls(uri=str(path))
+
+    @classmethod
+    def from_uris(cls, uris: list, *, validate: bool = True) -> list['File']:
+        """Create Files for a batch of URIs.
+
+        With validate=False (trusted input), instances are built via
+        model_construct with only uri and, for local inputs, an absolute
+        path filled in - downloads, stat calls and metadata population
+        are all skipped.
+        """
+        if validate:
+            return [cls(uri) for uri in uris]
+        token = _RAW_CONSTRUCT.set(True)
+        try:
+            return [
+                cls.model_construct(
+                    uri=uri,
+                    path=None if uri.startswith(('http://', 'https://')) else os.path.abspath(uri),
+                )
+                for uri in uris
+            ]
+        finally:
+            _RAW_CONSTRUCT.reset(token)
+
+    @staticmethod
+    async def adownload(url: str, path: Union[str, os.PathLike]) -> str:
+        """Asynchronously stream a URL to the given path.
+
+        Overlaps network receive with disk write via aiohttp + aiofiles,
+        so many downloads can share one event loop instead of pinning a
+        thread each. Returns the destination path.
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise RuntimeError(
+                "The 'aiohttp' package is required for async downloads. "
+                "Install it with: pip install aiohttp"
+            )
+        try:
+            import aiofiles
+        except ImportError:
+            raise RuntimeError(
+                "The 'aiofiles' package is required for async downloads. "
+                "Install it with: pip install aiofiles"
+            )
+
+        headers = {'User-Agent': _USER_AGENT}
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url, headers=headers) as response:
+                response.raise_for_status()
+                async with aiofiles.open(path, 'wb') as out_file:
+                    async for chunk in response.content.iter_chunked(_download_chunk_size()):
+                        await out_file.write(chunk)
+        return str(path)
+
+    @classmethod
+    async def gather(cls, urls: list, *, concurrency: int = 8) -> list['File']:
+        """Download many URLs concurrently and return their File instances.
+
+        URLs already present in the cache are not re-fetched; fresh ones
+        are downloaded into the cache (at most ``concurrency`` at a time)
+        before the Files are constructed against the cached copies.
+        """
+        import asyncio
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(url: str) -> None:
+            cache_path = cls._get_cache_path(url)
+            if cache_path.exists():
+                return
+            async with semaphore:
+                tmp_path = str(cache_path) + '.tmp'
+                try:
+                    await cls.adownload(url, tmp_path)
+                    os.rename(tmp_path, cache_path)
+                except Exception:
+                    try:
+                        os.unlink(tmp_path)
+                    except OSError:
+                        pass
+                    raise
+
+        remote = [url for url in urls if url.startswith(('http://', 'https://'))]
+        await asyncio.gather(*(fetch(url) for url in remote))
+        return [cls(uri=url) for url in urls]
     
     def _guess_content_type(self) -> Optional[str]:
         """Guess the MIME type of the file."""
-        return mimetypes.guess_type(self.path)[0]
+        ext = os.path.splitext(self.path)[1].lower()
+        mime = _FAST_MIME.get(ext)
+        if mime:
+            return mime
+        if ext in mimetypes.encodings_map or ext in mimetypes.suffix_map:
+            # Compound suffixes (.tar.gz, .tgz, ...) resolve from the full
+            # name so e.g. foo.tar.gz keeps reporting application/x-tar
+            return mimetypes.guess_type(self.path)[0]
+        return _guess_by_ext(ext)
     
     def _get_file_size(self) -> int:
         """Get the size of the file in bytes."""
@@ -231,10 +661,13 @@ class File(BaseModel):
     
     def refresh_metadata(self) -> None:
         """Refresh all metadata from the file."""
-        if os.path.exists(self.path):
-            self.content_type = self._guess_content_type()
-            self.size = self._get_file_size()  # Always update size
-            self.filename = self._get_filename()
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return
+        self.content_type = self._guess_content_type()
+        self.size = st.st_size  # Always update size
+        self.filename = self._get_filename()
 
     # @classmethod
     # def __get_pydantic_core_schema__(
@@ -260,6 +693,28 @@ class File(BaseModel):
     #         serialization=serialization,
     #     )
 
+    @classmethod
+    def model_json_schema(cls, by_alias: bool = False, **kwargs: Any) -> dict[str, Any]:
+        """Return the File JSON schema, memoized per argument set.
+
+        The schema is deterministic for a given class and arguments but
+        gets requested per API call in some pydantic paths; callers must
+        treat the returned dict as read-only.
+        """
+        try:
+            cache_key = (by_alias, tuple(sorted(kwargs.items())))
+        except TypeError:
+            return super().model_json_schema(by_alias=by_alias, **kwargs)
+        cache = cls.__dict__.get('_schema_cache')
+        if cache is None:
+            cache = {}
+            cls._schema_cache = cache
+        cached = cache.get(cache_key)
+        if cached is None:
+            cached = super().model_json_schema(by_alias=by_alias, **kwargs)
+            cache[cache_key] = cached
+        return cached
+
     @classmethod
     def __get_pydantic_json_schema__(
         cls, schema: CoreSchema, handler: GetJsonSchemaHandler
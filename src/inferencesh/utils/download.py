@@ -1,7 +1,6 @@
 import hashlib
 import os
 import urllib.parse
-import shutil
 from pathlib import Path
 from typing import Union
 
@@ -51,6 +50,7 @@ def download(url: str, directory: Union[str, Path, StorageDir]) -> str:
     # Download the file
     file = File(url)
     if file.path:
+        import shutil
         shutil.copy2(file.path, output_path)
         # Prevent the File instance from deleting its temporary file
         file._tmp_path = None
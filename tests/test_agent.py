@@ -0,0 +1,140 @@
+import base64
+import threading
+import time
+
+import pytest
+
+from inferencesh.agent import Agent, AgentConfig, _iter_sse_data, _iter_typed_sse
+
+
+@pytest.fixture
+def agent():
+    return Agent(AgentConfig(api_key="test-key"), "infsh/test-agent@abc123")
+
+
+# =============================================================================
+# upload_files
+# =============================================================================
+
+def test_upload_files_single_create_request(agent, monkeypatch):
+    requests_made = []
+
+    def fake_request(method, endpoint, data=None):
+        requests_made.append((method, endpoint, data))
+        return [
+            {"uri": f"file_{i}", "upload_url": f"https://storage/{i}", "content_type": f["content_type"]}
+            for i, f in enumerate(data["files"])
+        ]
+
+    puts = []
+    monkeypatch.setattr(agent, "_request", fake_request)
+    monkeypatch.setattr(agent, "_put_signed", lambda url, body, ct: puts.append((url, body, ct)))
+
+    result = agent.upload_files([b"one", b"two!!"])
+
+    # All records created with a single POST /files
+    assert len(requests_made) == 1
+    method, endpoint, data = requests_made[0]
+    assert (method, endpoint) == ("post", "/files")
+    assert data == {"files": [
+        {"uri": "", "content_type": "application/octet-stream", "size": 3},
+        {"uri": "", "content_type": "application/octet-stream", "size": 5},
+    ]}
+    assert [r["uri"] for r in result] == ["file_0", "file_1"]
+    assert sorted(puts) == [
+        ("https://storage/0", b"one", "application/octet-stream"),
+        ("https://storage/1", b"two!!", "application/octet-stream"),
+    ]
+
+
+def test_upload_files_preserves_input_order(agent, monkeypatch):
+    def fake_request(method, endpoint, data=None):
+        return [
+            {"uri": f"file_{i}", "upload_url": f"https://storage/{i}"}
+            for i in range(len(data["files"]))
+        ]
+
+    started = threading.Event()
+
+    def slow_put(url, body, content_type):
+        # Make the first PUT finish last so completion order differs
+        # from submission order
+        if url.endswith("/0") and not started.is_set():
+            started.set()
+            time.sleep(0.05)
+
+    monkeypatch.setattr(agent, "_request", fake_request)
+    monkeypatch.setattr(agent, "_put_signed", slow_put)
+
+    result = agent.upload_files([b"a", b"b", b"c", b"d"])
+    assert [r["uri"] for r in result] == ["file_0", "file_1", "file_2", "file_3"]
+
+
+def test_upload_files_missing_upload_url(agent, monkeypatch):
+    monkeypatch.setattr(agent, "_request", lambda *a, **k: [{"uri": "file_0"}])
+    monkeypatch.setattr(agent, "_put_signed", lambda *a, **k: None)
+
+    with pytest.raises(RuntimeError, match="No upload URL"):
+        agent.upload_files([b"data"])
+
+
+def test_upload_files_record_count_mismatch(agent, monkeypatch):
+    # Fewer records than requested files must raise instead of silently
+    # skipping the trailing uploads
+    monkeypatch.setattr(
+        agent, "_request",
+        lambda *a, **k: [{"uri": "file_0", "upload_url": "https://storage/0"}],
+    )
+    monkeypatch.setattr(agent, "_put_signed", lambda *a, **k: None)
+
+    with pytest.raises(RuntimeError, match="returned 1 records for 2 files"):
+        agent.upload_files([b"a", b"b"])
+
+
+def test_spool_base64_accepts_wrapped_input():
+    raw = b"x" * 200_000
+    for encoded in (base64.encodebytes(raw).decode(), base64.b64encode(raw).decode()):
+        spooled, size = Agent._spool_base64(encoded)
+        assert size == len(raw)
+        assert spooled.read() == raw
+
+
+# =============================================================================
+# SSE parsers
+# =============================================================================
+
+def test_iter_sse_data_parses_payloads():
+    lines = [
+        b": comment",
+        b"",
+        b"data: {\"a\": 1}",
+        b"data:{\"b\": 2}",  # no space after colon
+        b"data: not-json",  # skipped
+        b"data: {\"c\": 3}",
+    ]
+    assert list(_iter_sse_data(iter(lines))) == [{"a": 1}, {"b": 2}, {"c": 3}]
+
+
+def test_iter_sse_data_reports_event_ids():
+    ids = []
+    lines = [b"id: 41", b"data: {\"a\": 1}", b"id: 42"]
+    assert list(_iter_sse_data(iter(lines), on_id=ids.append)) == [{"a": 1}]
+    assert ids == ["41", "42"]
+
+
+def test_iter_typed_sse_tracks_event_types():
+    lines = [
+        b"event: message_update",
+        b"data: {\"a\": 1}",
+        b"",  # event boundary resets the type
+        b"data: {\"b\": 2}",
+        b"event: chat_update",
+        b"id: 7",
+        b"data: {\"c\": 3}",
+    ]
+    events = list(_iter_typed_sse(iter(lines)))
+    assert events == [
+        ("message_update", {"a": 1}),
+        ("message", {"b": 2}),
+        ("chat_update", {"c": 3}),
+    ]
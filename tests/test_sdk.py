@@ -177,4 +177,101 @@ def test_file_schema():
     assert file.model_json_schema()["oneOf"][0]["properties"]["path"] is not None
     assert file.model_json_schema()["oneOf"][0]["properties"]["content_type"] is not None
     assert file.model_json_schema()["oneOf"][0]["properties"]["size"] is not None
-    assert file.model_json_schema()["oneOf"][0]["properties"]["filename"] is not None
\ No newline at end of file
+    assert file.model_json_schema()["oneOf"][0]["properties"]["filename"] is not None
+class _FakeRangeResponse:
+    def __init__(self, status_code, content, headers=None):
+        self.status_code = status_code
+        self._content = content
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP error {self.status_code}")
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self._content), chunk_size):
+            yield self._content[start:start + chunk_size]
+
+
+class _FakeRangeSession:
+    """Minimal Range-capable server double for the pooled backend."""
+
+    def __init__(self, payload, honor_ranges=True):
+        self.payload = payload
+        self.honor_ranges = honor_ranges
+        self.range_requests = []
+
+    def head(self, url, headers=None, allow_redirects=True, timeout=None):
+        return _FakeRangeResponse(200, b"", headers={
+            "accept-ranges": "bytes",
+            "content-length": str(len(self.payload)),
+        })
+
+    def get(self, url, headers=None, stream=True, timeout=None):
+        byte_range = (headers or {}).get("Range")
+        if byte_range and self.honor_ranges:
+            self.range_requests.append(byte_range)
+            start, end = map(int, byte_range.split("=")[1].split("-"))
+            return _FakeRangeResponse(206, self.payload[start:end + 1])
+        return _FakeRangeResponse(200, self.payload, headers={
+            "content-length": str(len(self.payload)),
+        })
+
+
+@pytest.fixture
+def ranged_download_env(tmp_path, monkeypatch):
+    import inferencesh.models.file as file_mod
+
+    monkeypatch.setenv("FILE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("INFERENCESH_DL_BACKEND", "requests")
+    # Shrink the thresholds so a small payload exercises sharding
+    monkeypatch.setattr(file_mod, "_RANGED_MIN_SIZE", 1024)
+    monkeypatch.setattr(file_mod, "_RANGED_SHARD_SIZE", 64 * 1024)
+    return file_mod
+
+
+def test_file_ranged_download_assembles_shards(ranged_download_env, monkeypatch):
+    file_mod = ranged_download_env
+    payload = bytes(range(256)) * 1000  # 250 KiB -> 4 shards of 64 KiB
+    session = _FakeRangeSession(payload)
+    monkeypatch.setattr(file_mod, "_pooled_session", lambda: session)
+
+    file = File(uri="https://example.com/big.bin")
+
+    with open(file.path, "rb") as f:
+        assert f.read() == payload
+    assert len(session.range_requests) == 4
+    assert session.range_requests[0] == "bytes=0-65535"
+
+
+def test_file_ranged_download_falls_back_on_200(ranged_download_env, monkeypatch):
+    file_mod = ranged_download_env
+    payload = b"ignored-range-server" * 10000
+    session = _FakeRangeSession(payload, honor_ranges=False)
+    monkeypatch.setattr(file_mod, "_pooled_session", lambda: session)
+
+    file = File(uri="https://example.com/stubborn.bin")
+
+    with open(file.path, "rb") as f:
+        assert f.read() == payload
+    # The server ignored Range, so no 206 was ever recorded
+    assert session.range_requests == []
+
+
+def test_file_content_type_compound_extensions(tmp_path):
+    cases = {
+        "model.tar.gz": "application/x-tar",
+        "weights.safetensors.gz": None,
+        "image.png": "image/png",
+        "archive.tgz": "application/x-tar",
+    }
+    for name, expected in cases.items():
+        path = tmp_path / name
+        path.write_bytes(b"data")
+        assert File(path=str(path)).content_type == expected, name